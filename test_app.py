@@ -189,6 +189,227 @@ def test_csv_exporter():
         print(f"❌ CSV出力テストエラー: {e}")
         return False
 
+def test_csv_round_trip():
+    """CSV一括出力と読み込みの往復テスト"""
+    print("\n" + "=" * 50)
+    print("CSV往復テスト")
+    print("=" * 50)
+    
+    import re
+    import shutil
+    import tempfile
+    from unittest import mock
+    from wildlife_detector.utils import csv_exporter
+    from wildlife_detector.utils.csv_exporter import CSVExporter, CSVAnalyzer, RESULT_FIELDNAMES
+    from wildlife_detector.core.species_detector import DetectionResult
+    
+    detections = [
+        {
+            'species': 'Passer montanus',
+            'common_name': 'スズメ',
+            'scientific_name': 'Passer montanus',
+            'confidence': 0.95,
+            'category': 'bird',
+            'bbox': [10, 20, 100, 150]
+        },
+        {
+            'species': 'Corvus macrorhynchos',
+            'common_name': 'ハシブトガラス',
+            'scientific_name': 'Corvus macrorhynchos',
+            'confidence': 0.8,
+            'category': 'bird',
+            'bbox': [200, 40, 320, 180]
+        }
+    ]
+    results = [
+        DetectionResult("images/IMG_0001.jpg", detections, processing_time=0.5),
+        DetectionResult("images/IMG_0002.jpg", [], processing_time=0.25),
+        DetectionResult("images/IMG_0003.jpg", [], success=False, error_message="読み込み失敗"),
+    ]
+    
+    test_dir = tempfile.mkdtemp()
+    try:
+        exporter = CSVExporter(test_dir)
+        output_files = exporter.export_all(results)
+        
+        # 3ファイルは同じタイムスタンプを共有し、以降の個別出力には持ち越さない
+        timestamps = {
+            re.search(r'_(\d{8}_\d{6})_', os.path.basename(path)).group(1)
+            for path in output_files.values()
+        }
+        assert len(timestamps) == 1, f"タイムスタンプが一致しません: {timestamps}"
+        assert exporter._run_timestamp is None, "export_all 後もタイムスタンプが残っています"
+        print(f"✓ 一括出力: {sorted(output_files)}")
+        
+        # 一時ファイルが残っていないこと
+        leftovers = [name for name in os.listdir(test_dir) if name.endswith('.tmp')]
+        assert not leftovers, f"一時ファイルが残っています: {leftovers}"
+        
+        df = CSVAnalyzer.load_results(output_files['results'])
+        assert list(df.columns) == list(RESULT_FIELDNAMES), "列が一致しません"
+        assert len(df) == 4, f"行数が一致しません: {len(df)}"
+        assert df['common_name'].tolist()[:2] == ['スズメ', 'ハシブトガラス']
+        assert df['confidence'].tolist()[:2] == [0.95, 0.8]
+        assert df['error_message'].tolist()[3] == "読み込み失敗"
+        # 空欄は欠損値として読み込まれる
+        assert df['common_name'].isna().tolist() == [False, False, True, True]
+        print("✓ 読み込み結果が出力内容と一致")
+        
+        # 読み込み経路（pandas / pyarrow / メモリマップ）によらず欠損値の扱いが同じこと
+        with mock.patch.object(csv_exporter, 'PYARROW_AVAILABLE', False):
+            plain_df = CSVAnalyzer.load_results(output_files['results'])
+        assert plain_df.isna().equals(df.isna()), "読み込み経路で欠損値が異なります"
+        if csv_exporter.PYARROW_AVAILABLE:
+            with mock.patch.object(csv_exporter, 'MMAP_READ_THRESHOLD', 0):
+                mmap_df = CSVAnalyzer.load_results(output_files['results'])
+            assert mmap_df.isna().equals(df.isna()), "メモリマップ読み込みで欠損値が異なります"
+            print("✓ メモリマップ読み込みと一致")
+        
+        print("CSV往復テストが成功しました！")
+        return True
+    
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+def test_organize_collisions():
+    """画像振り分けのファイル名重複回避テスト"""
+    print("\n" + "=" * 50)
+    print("画像振り分けテスト")
+    print("=" * 50)
+    
+    import shutil
+    import tempfile
+    from wildlife_detector.utils.file_manager import FileManager
+    from wildlife_detector.core.species_detector import DetectionResult
+    
+    detection = {
+        'species': 'deer',
+        'common_name': 'シカ',
+        'scientific_name': 'Cervus nippon',
+        'confidence': 0.9,
+        'category': 'mammal'
+    }
+    
+    test_dir = tempfile.mkdtemp()
+    try:
+        # 別々のフォルダにある同名の画像（内容はそれぞれ異なる）
+        source_files = []
+        for index in range(3):
+            source_dir = os.path.join(test_dir, "source", f"camera{index}")
+            os.makedirs(source_dir)
+            source_path = os.path.join(source_dir, "IMG_0001.jpg")
+            with open(source_path, 'wb') as f:
+                f.write(f"camera{index}".encode())
+            source_files.append(source_path)
+        
+        results = [DetectionResult(path, [detection]) for path in source_files]
+        file_manager = FileManager(os.path.join(test_dir, "output"))
+        
+        organization_result = file_manager.organize_images_by_species(results)
+        species_dir = os.path.join(organization_result['output_directory'], "シカ")
+        names = sorted(os.listdir(species_dir))
+        assert names == [
+            "IMG_0001_deer_0.900.jpg",
+            "IMG_0001_deer_0.900_001.jpg",
+            "IMG_0001_deer_0.900_002.jpg",
+        ], f"重複回避後のファイル名が一致しません: {names}"
+        print(f"✓ 重複回避: {names}")
+        
+        # すべての画像が上書きされずに残っていること
+        contents = set()
+        for name in names:
+            with open(os.path.join(species_dir, name), 'rb') as f:
+                contents.add(f.read())
+        assert contents == {f"camera{index}".encode() for index in range(3)}, "上書きされた画像があります"
+        
+        species_info = organization_result['species_folders']["シカ"]
+        assert species_info['file_count'] == 3
+        assert abs(species_info['avg_confidence'] - 0.9) < 1e-9
+        
+        # 同じ振り分け先への2回目の振り分けは連番の続きから付ける
+        file_manager.organize_images_by_species(results)
+        names = sorted(os.listdir(species_dir))
+        assert names[3:] == [
+            "IMG_0001_deer_0.900_003.jpg",
+            "IMG_0001_deer_0.900_004.jpg",
+            "IMG_0001_deer_0.900_005.jpg",
+        ], f"2回目のファイル名が一致しません: {names}"
+        print("✓ 2回目の振り分けで連番が継続")
+        
+        print("画像振り分けテストが成功しました！")
+        return True
+    
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+def test_file_copy_fallbacks():
+    """ファイルコピーのフォールバックテスト（高速コピーが使えない環境を再現）"""
+    print("\n" + "=" * 50)
+    print("ファイルコピーテスト")
+    print("=" * 50)
+    
+    import contextlib
+    import errno
+    import shutil
+    import tempfile
+    from unittest import mock
+    from wildlife_detector.utils import file_manager
+    
+    def raise_oserror(*args):
+        raise OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+    
+    def raise_typeerror(*args):
+        raise TypeError("offset must be an integer")
+    
+    def return_zero(*args):
+        # 一部のFS（overlayfs・FUSE等）のように何もコピーせず0を返す
+        return 0
+    
+    def write_then_fail(src_fd, dst_fd, count):
+        # 途中まで書き込んでから失敗（先頭からやり直されることを確認）
+        os.write(dst_fd, b"partial")
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+    
+    cases = [
+        ("通常", {}),
+        ("copy_file_range失敗 → sendfile", {'copy_file_range': raise_oserror}),
+        ("途中まで書き込み後に失敗", {'copy_file_range': write_then_fail}),
+        ("copy_file_range が即座に0を返す", {'copy_file_range': return_zero}),
+        ("copy_file_range・sendfile とも即座に0を返す",
+         {'copy_file_range': return_zero, 'sendfile': return_zero}),
+        ("sendfile TypeError → バッファコピー",
+         {'copy_file_range': raise_oserror, 'sendfile': raise_typeerror}),
+        ("sendfile ENOTSOCK → バッファコピー",
+         {'copy_file_range': raise_oserror, 'sendfile': raise_oserror}),
+    ]
+    
+    test_dir = tempfile.mkdtemp()
+    try:
+        source_path = os.path.join(test_dir, "source.jpg")
+        data = os.urandom(3 * 1024 * 1024 + 17)  # バッファサイズの倍数にならないサイズ
+        with open(source_path, 'wb') as f:
+            f.write(data)
+        os.utime(source_path, (1000000000, 1000000000))
+        
+        for index, (name, patches) in enumerate(cases):
+            target_path = os.path.join(test_dir, f"target_{index}.jpg")
+            with mock.patch.object(file_manager, '_copy_file2', None), \
+                 mock.patch.object(file_manager, '_SENDFILE_SUPPORTED', True):
+                with (mock.patch.multiple(os, create=True, **patches) if patches
+                      else contextlib.nullcontext()):
+                    file_manager._fast_copy2(source_path, target_path)
+            
+            with open(target_path, 'rb') as f:
+                assert f.read() == data, f"{name}: 内容が一致しません"
+            assert os.stat(target_path).st_mtime == 1000000000, f"{name}: 更新日時が一致しません"
+            print(f"✓ {name}")
+        
+        print("ファイルコピーテストが成功しました！")
+        return True
+    
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
 def test_gui_creation():
     """GUI作成テスト（非表示）"""
     print("\n" + "=" * 50)
@@ -238,6 +459,9 @@ def main():
         ("設定管理テスト", test_config),
         ("種検出器テスト", test_species_detector),
         ("CSV出力テスト", test_csv_exporter),
+        ("CSV往復テスト", test_csv_round_trip),
+        ("画像振り分けテスト", test_organize_collisions),
+        ("ファイルコピーテスト", test_file_copy_fallbacks),
         ("GUI作成テスト", test_gui_creation),
     ]
     
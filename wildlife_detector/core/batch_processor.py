@@ -166,15 +166,7 @@ class BatchProcessor:
         if not self.detector:
             raise Exception("BatchProcessor が初期化されていません")
         
-        job_id = f"batch_{int(time.time())}"
-        
-        # ジョブとプログレスの初期化
-        self.current_job = BatchJob(image_paths, "", job_id)
-        self.progress = BatchProgress(job_id, total=len(image_paths))
-        self.results = []
-        self.is_running = True
-        self.stop_requested = False
-        self._start_time = time.time()
+        self.begin_batch(image_paths)
         
         if progress_callback:
             self.progress_callback = progress_callback
@@ -190,11 +182,7 @@ class BatchProcessor:
                 # マルチスレッド処理
                 results = self._process_parallel(image_paths)
             
-            # 統計情報の生成
-            self._generate_statistics(results)
-            
-            # 処理時間の更新
-            self.progress.elapsed_time = time.time() - self._start_time
+            self.finish_batch(results)
             
             self.logger.info(f"バッチ処理完了: {self.progress.success}成功 / {self.progress.failed}失敗")
             return results
@@ -205,6 +193,62 @@ class BatchProcessor:
         finally:
             self.is_running = False
     
+    def begin_batch(self, image_paths: List[str]) -> str:
+        """
+        バッチ処理ジョブの開始準備
+        
+        Args:
+            image_paths: 処理する画像パスのリスト
+            
+        Returns:
+            str: ジョブID
+        """
+        job_id = f"batch_{int(time.time())}"
+        
+        # ジョブとプログレスの初期化
+        self.current_job = BatchJob(image_paths, "", job_id)
+        self.progress = BatchProgress(job_id, total=len(image_paths))
+        self.results = []
+        self.is_running = True
+        self.stop_requested = False
+        self._start_time = time.time()
+        
+        return job_id
+    
+    def finish_batch(self, results: List[DetectionResult]):
+        """
+        バッチ処理ジョブの終了処理
+        
+        Args:
+            results: 検出結果のリスト
+        """
+        # 統計情報の生成
+        self._generate_statistics(results)
+        
+        # 処理時間の更新
+        if self.progress:
+            self.progress.elapsed_time = time.time() - self._start_time
+        
+        self.is_running = False
+    
+    def process_image(self, image_path: str) -> DetectionResult:
+        """
+        単一画像の処理と進捗カウントの更新
+        
+        Args:
+            image_path: 画像ファイルのパス
+            
+        Returns:
+            DetectionResult: 検出結果
+        """
+        result = self._process_single_image(image_path)
+        self.record_result(result)
+        return result
+    
+    def record_result(self, result: DetectionResult):
+        """処理済み結果を進捗カウントに反映"""
+        self._update_progress_counts(result.success)
+    
     def _process_sequential(self, image_paths: List[str]) -> List[DetectionResult]:
         """シーケンシャル処理"""
         results = []
@@ -12,6 +12,28 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# orjson（高速なJSONシリアライザ、任意）
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _read_json(path) -> Dict[str, Any]:
+    """JSONファイルの読み込み（orjsonが利用可能な場合は使用）"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path, data: Dict[str, Any]):
+    """JSONファイルの書き込み（インデント2・非ASCII文字はそのまま出力）"""
+    if ORJSON_AVAILABLE:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 @dataclass
 class AppConfig:
     """アプリケーション設定"""
@@ -124,6 +146,7 @@ class ConfigManager:
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file or self._get_default_config_path()
         self.config = AppConfig.get_default()
+        self._last_saved: Optional[Dict[str, Any]] = None  # 最後に読み書きした設定内容
         
         # 設定ディレクトリの作成
         config_dir = Path(self.config_file).parent
@@ -140,10 +163,10 @@ class ConfigManager:
         """設定の読み込み"""
         try:
             if Path(self.config_file).exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _read_json(self.config_file)
                 
                 self.config = AppConfig.from_dict(data)
+                self._last_saved = self.config.to_dict()
                 logger.info("設定ファイルを読み込みました")
                 
                 # 設定の検証
@@ -154,6 +177,7 @@ class ConfigManager:
                         logger.warning(f"  - {error}")
                     logger.warning("デフォルト値を使用します")
                     self.config = AppConfig.get_default()
+                    self._last_saved = None
             else:
                 logger.info("設定ファイルが見つかりません。デフォルト設定を使用します")
                 self.config = AppConfig.get_default()
@@ -168,8 +192,13 @@ class ConfigManager:
         return self.config
     
     def save_config(self) -> bool:
-        """設定の保存"""
+        """設定の保存（前回の読み書きから内容が変わっていなければ書き込みを省略）"""
         try:
+            config_data = self.config.to_dict()
+            if config_data == self._last_saved:
+                logger.debug("設定に変更がないため保存を省略しました")
+                return True
+            
             # 設定の検証
             errors = self.config.validate()
             if errors:
@@ -179,11 +208,9 @@ class ConfigManager:
                 return False
             
             # JSON形式で保存
-            config_data = self.config.to_dict()
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            _write_json(self.config_file, config_data)
             
+            self._last_saved = config_data
             logger.info(f"設定を保存しました: {self.config_file}")
             return True
         
@@ -266,8 +293,7 @@ class ConfigManager:
                 return False
             
             # バックアップファイルを読み込んで検証
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(backup_file)
             
             test_config = AppConfig.from_dict(data)
             errors = test_config.validate()
@@ -346,8 +372,7 @@ class ConfigManager:
                 'export_source': str(self.config_file)
             }
             
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            _write_json(export_file, config_data)
             
             logger.info(f"設定をエクスポートしました: {export_path}")
             return True
@@ -364,8 +389,7 @@ class ConfigManager:
                 logger.error(f"インポートファイルが見つかりません: {import_path}")
                 return False
             
-            with open(import_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(import_file)
             
             # エクスポート情報を除去
             if '_export_info' in data:
@@ -8,7 +8,7 @@ Google SpeciesNetを使用した高精度な種レベル分類
 import os
 import logging
 from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 import json
 import time
@@ -37,12 +37,21 @@ class DetectionResult:
     processing_time: float = 0.0
     success: bool = True
     error_message: str = ""
+    _best_detection: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def get_best_detection(self) -> Optional[Dict[str, Any]]:
-        """最も信頼度の高い検出結果を取得"""
+        """最も信頼度の高い検出結果を取得（初回の計算結果をキャッシュ）"""
         if not self.detections:
             return None
-        return max(self.detections, key=lambda x: x.get('confidence', 0))
+        if self._best_detection is None:
+            self._best_detection = max(self.detections, key=lambda x: x.get('confidence', 0))
+        return self._best_detection
+    
+    def filter_by_confidence(self, threshold: float) -> List[Dict[str, Any]]:
+        """信頼度が閾値以上の検出結果のみを取得"""
+        return [d for d in self.detections if d.get('confidence', 0) >= threshold]
     
     def get_species_count(self) -> int:
         """検出された種の数を取得"""
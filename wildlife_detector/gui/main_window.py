@@ -7,19 +7,24 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import threading
+from typing import List, Dict, Any, Optional, Tuple, Callable
 import time
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, CancelledError, FIRST_COMPLETED, wait
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QTabWidget, QLabel, QPushButton, QLineEdit, QTextEdit, QProgressBar,
-    QFileDialog, QMessageBox, QTableWidget, QTableWidgetItem,
+    QTabWidget, QLabel, QPushButton, QLineEdit, QPlainTextEdit, QProgressBar,
+    QFileDialog, QMessageBox, QTableWidget, QTableWidgetItem, QTableView,
     QSpinBox, QDoubleSpinBox, QCheckBox, QComboBox, QGroupBox,
     QSplitter, QFrame, QScrollArea, QApplication, QStatusBar,
     QMenuBar, QToolBar
 )
-from PySide6.QtCore import Qt, QThread, QTimer, Signal, QSize
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, Signal, QSize,
+    QAbstractTableModel, QModelIndex
+)
 from PySide6.QtGui import QFont, QIcon, QPixmap, QPalette, QColor, QAction
 
 from ..core.config import ConfigManager, AppConfig
@@ -30,58 +35,511 @@ from ..utils.file_manager import FileManager
 
 logger = logging.getLogger(__name__)
 
-class ProcessingThread(QThread):
-    """バッチ処理用スレッド"""
+# 対応画像拡張子
+SUPPORTED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'})
+
+# スタイルシート（再生成せずモジュール定数として共有）
+START_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        font-weight: bold;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+STOP_BUTTON_QSS = """
+    QPushButton {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        font-weight: bold;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #da190b;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+STATS_VALUE_QSS = "QLabel#statsValue { font-weight: bold; color: #2196F3; }"
+
+SUMMARY_VALUE_QSS = "QLabel#summaryValue { font-weight: bold; }"
+
+DARK_QSS = """
+    QMainWindow {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QWidget {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QGroupBox {
+        border: 2px solid #555;
+        border-radius: 5px;
+        margin-top: 1ex;
+        color: #ffffff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+"""
+
+# ファイルサイズのキャッシュ（プロセス存続中は再statしない）
+_file_size_cache: Dict[str, int] = {}
+
+def _cached_file_size(file_path: str) -> int:
+    """ファイルサイズの取得（キャッシュ付き）"""
+    size = _file_size_cache.get(file_path)
+    if size is None:
+        size = os.stat(file_path).st_size
+        _file_size_cache[file_path] = size
+    return size
+
+class ProcessingSignals(QObject):
+    """バッチ処理ワーカーからGUIスレッドへのシグナル中継"""
     
     progress_updated = Signal(int, int, str, str)  # current, total, status, filename
     processing_completed = Signal(list, object)  # results, stats
     processing_error = Signal(str)
+    processing_finished = Signal()
+
+class ProcessingWorker:
+    """
+    バッチ処理ワーカー（共有スレッドプールで実行）
     
-    def __init__(self, image_files: List[str], config: AppConfig):
-        super().__init__()
-        self.image_files = image_files
-        self.config = config
-        self.processor = None
+    画像ごとのデコードと推論を max_workers 並列で先行実行し、結果は入力順に集約する。
+    集約ループ自体もプールの1スレッドで動くため、プールは max_workers + 1 で作成する。
+    """
+    
+    PROGRESS_INTERVAL = 0.05  # 進捗通知の最小間隔（秒）
+    
+    def __init__(self, image_files: List[str], processor: BatchProcessor,
+                 pool: ThreadPoolExecutor):
+        self.image_files = list(image_files)
+        self.processor = processor  # 初期化済み（実行間で再利用）
+        self.pool = pool
+        self.signals = ProcessingSignals()
         self.is_cancelled = False
+        self._running = False
+        # 先行実行中の (画像パス, Future)。深さを制限してメモリを抑える
+        self.prefetch_depth = max(1, 2 * processor.batch_size)
+        self._pending: deque = deque()
     
-    def run(self):
-        """処理実行"""
+    def start(self):
+        """処理開始"""
         try:
-            self.processor = BatchProcessor(self.config)
-            
-            if not self.processor.initialize():
-                self.processing_error.emit("バッチ処理器の初期化に失敗しました")
-                return
-            
-            # 進捗コールバック設定
-            def progress_callback(current, total, status, filename):
-                if not self.is_cancelled:
-                    self.progress_updated.emit(current, total, status, filename)
+            self.processor.begin_batch(self.image_files)
+            self._running = True
+            self.pool.submit(self._run)
+        
+        except Exception as e:
+            logger.error(f"処理ワーカーエラー: {str(e)}")
+            self.signals.processing_error.emit(str(e))
+            self._running = False
+            self.signals.processing_finished.emit()
+    
+    def _process_image(self, image_path: str) -> Optional[DetectionResult]:
+        """単一画像のデコードと推論（ワーカースレッドで実行、キャンセル済みならNone）"""
+        if self.is_cancelled:
+            return None
+        
+        try:
+            return self.processor.process_image(image_path)
+        except Exception as e:
+            logger.error(f"画像処理エラー ({image_path}): {str(e)}")
+            result = DetectionResult(
+                image_path=image_path,
+                detections=[],
+                success=False,
+                error_message=str(e)
+            )
+            self.processor.record_result(result)
+            return result
+    
+    def _fill_prefetch(self, files):
+        """先行実行キューが埋まるまで画像処理タスクを投入"""
+        while not self.is_cancelled and len(self._pending) < self.prefetch_depth:
+            image_path = next(files, None)
+            if image_path is None:
+                break
+            self._pending.append((image_path, self.pool.submit(self._process_image, image_path)))
+    
+    def _run(self):
+        """集約ループ（完了した画像を入力順に取り出して進捗を通知）"""
+        results: List[DetectionResult] = []
+        total = len(self.image_files)
+        files = iter(self.image_files)
+        last_progress_emit = 0.0
+        
+        try:
+            self._fill_prefetch(files)
             
-            # バッチ処理実行
-            results = self.processor.process_batch(self.image_files, progress_callback)
-            stats = self.processor.get_statistics()
+            while self._pending and not self.is_cancelled:
+                image_path, future = self._pending.popleft()
+                # 停止操作で取り消されたタスクは通常の停止として扱う
+                if future.cancelled():
+                    break
+                try:
+                    result = future.result()
+                except CancelledError:
+                    break
+                if result is None:
+                    break
+                results.append(result)
+                self._fill_prefetch(files)
+                
+                # 進捗通知の間引き（最後の1件は必ず通知）
+                now = time.monotonic()
+                if not self.is_cancelled and (
+                    len(results) == total or now - last_progress_emit >= self.PROGRESS_INTERVAL
+                ):
+                    last_progress_emit = now
+                    self.signals.progress_updated.emit(
+                        len(results), total, "処理中", os.path.basename(image_path)
+                    )
             
+            # キャンセル時は統計を生成しない（次の実行と処理器を共有するため）
             if not self.is_cancelled:
-                self.processing_completed.emit(results, stats)
+                self.processor.finish_batch(results)
+                self.signals.processing_completed.emit(results, self.processor.get_statistics())
         
         except Exception as e:
-            logger.error(f"処理スレッドエラー: {str(e)}")
-            self.processing_error.emit(str(e))
+            logger.error(f"処理ワーカーエラー: {str(e)}")
+            self.signals.processing_error.emit(str(e))
         
         finally:
-            if self.processor:
-                self.processor.cleanup()
+            # 未着手のタスクは取り消し、実行中の推論は終了を待つ
+            # （処理器を次の実行と共有するため、終了通知までに処理器の使用を終える）
+            running = [future for _, future in self._pending if not future.cancel()]
+            self._pending.clear()
+            wait(running)
+            self._running = False
+            self.signals.processing_finished.emit()
+    
+    def is_running(self) -> bool:
+        """処理中かどうかを確認"""
+        return self._running
     
     def cancel_processing(self):
-        """処理キャンセル"""
+        """処理キャンセル（未着手のタスクを取り消し）"""
         self.is_cancelled = True
         if self.processor:
             self.processor.cancel_processing()
+        for _, future in list(self._pending):
+            future.cancel()
+
+class FolderScanThread(QThread):
+    """画像フォルダ検索用スレッド（サブフォルダ単位で並列走査）"""
+    
+    files_found = Signal(list, list)  # パス, サイズ（バイト、取得失敗時は-1）
+    
+    def __init__(self, folder: str, extensions: frozenset = SUPPORTED_EXTENSIONS,
+                 max_workers: int = 4):
+        super().__init__()
+        self.folder = folder
+        self.extensions = extensions
+        self.max_workers = max(1, max_workers)
+    
+    def run(self):
+        """検索実行"""
+        found_files = []
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._scan_directory, self.folder)}
+            
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, files = future.result()
+                    found_files.extend(files)
+                    pending.update(executor.submit(self._scan_directory, d) for d in subdirs)
+        
+        found_files.sort()
+        paths = [path for path, _ in found_files]
+        sizes = [size for _, size in found_files]
+        self.files_found.emit(paths, sizes)
+    
+    def _scan_directory(self, directory: str) -> Tuple[List[str], List[Tuple[str, int]]]:
+        """単一ディレクトリの走査（サブフォルダと画像ファイルの(パス, サイズ)を返す）"""
+        subdirs = []
+        files = []
+        extensions = self.extensions
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    name = entry.name
+                    if name[name.rfind('.'):].lower() in extensions:
+                        # DirEntry.stat はWindowsではscandir結果を再利用し、追加のシステムコール不要
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            size = -1
+                        files.append((entry.path, size))
+        except OSError as e:
+            logger.warning(f"フォルダ走査エラー ({directory}): {str(e)}")
+        
+        return subdirs, files
+
+class FileSizeSignals(QObject):
+    """ファイルサイズ取得結果のシグナル"""
+    
+    sizes_ready = Signal(int, list)  # generation, [(row, size_bytes), ...]
+
+class FileSizeWorker(QRunnable):
+    """ファイルサイズ取得ワーカー（GUIスレッド外でstatを実行）"""
+    
+    CHUNK_SIZE = 256
+    
+    def __init__(self, rows: List[Tuple[int, str]], generation: int,
+                 signals: FileSizeSignals):
+        super().__init__()
+        self.rows = rows  # [(row, file_path), ...]
+        self.generation = generation
+        self.signals = signals
+    
+    def run(self):
+        """サイズ取得実行"""
+        chunk = []
+        for row, file_path in self.rows:
+            try:
+                size = _cached_file_size(file_path)
+            except OSError:
+                size = FilesModel.SIZE_UNKNOWN
+            chunk.append((row, size))
+            
+            if len(chunk) >= self.CHUNK_SIZE:
+                self.signals.sizes_ready.emit(self.generation, chunk)
+                chunk = []
+        
+        if chunk:
+            self.signals.sizes_ready.emit(self.generation, chunk)
+
+class FilesModel(QAbstractTableModel):
+    """選択画像ファイル一覧のテーブルモデル（列ごとの配列で保持）"""
+    
+    HEADERS = ["ファイル名", "パス", "サイズ"]
+    SIZE_PENDING = -1  # 未取得
+    SIZE_UNKNOWN = -2  # 取得失敗
+    
+    def __init__(self, files: List[str], parent=None):
+        super().__init__(parent)
+        self._files = files  # MainWindow.image_files を共有
+        self._names: List[str] = [os.path.basename(f) for f in files]
+        self._sizes = array('q', [self.SIZE_PENDING]) * len(files)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._files)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            return self._names[row]
+        if column == 1:
+            return os.path.normpath(self._files[row])
+        
+        size = self._sizes[row]
+        if size == self.SIZE_PENDING:
+            return "..."
+        if size == self.SIZE_UNKNOWN:
+            return "不明"
+        return f"{size / (1024 * 1024):.2f} MB"
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+    
+    def append_files(self, files: List[str], sizes: Optional[List[int]] = None):
+        """
+        ファイルを末尾に追加
+        
+        Args:
+            files: 追加するファイルパス
+            sizes: 各ファイルのサイズ（バイト、不明な場合は負値。Noneの場合は未取得）
+        """
+        if not files:
+            return
+        first = len(self._files)
+        self.beginInsertRows(QModelIndex(), first, first + len(files) - 1)
+        self._files.extend(files)
+        self._names.extend(os.path.basename(f) for f in files)
+        if sizes is None:
+            self._sizes.extend(array('q', [self.SIZE_PENDING]) * len(files))
+        else:
+            self._sizes.extend(size if size >= 0 else self.SIZE_PENDING for size in sizes)
+        self.endInsertRows()
+    
+    def clear_files(self):
+        """全ファイルを削除"""
+        self.beginResetModel()
+        self._files.clear()
+        self._names.clear()
+        self._sizes = array('q')
+        self.endResetModel()
+    
+    def pending_size_rows(self, start_row: int = 0) -> List[Tuple[int, str]]:
+        """サイズ未取得の行を返す"""
+        sizes = self._sizes
+        files = self._files
+        return [
+            (row, files[row]) for row in range(start_row, len(files))
+            if sizes[row] == self.SIZE_PENDING
+        ]
+    
+    def set_sizes(self, sizes: List[Tuple[int, int]]):
+        """サイズ列の更新"""
+        if not sizes:
+            return
+        for row, size in sizes:
+            self._sizes[row] = size
+        rows = [row for row, _ in sizes]
+        self.dataChanged.emit(self.index(min(rows), 2), self.index(max(rows), 2))
+
+class ResultsModel(QAbstractTableModel):
+    """検出結果一覧のテーブルモデル（セルは表示時に生成）"""
+    
+    HEADERS = ["画像", "検出数", "種名", "信頼度", "カテゴリ", "処理時間"]
+    
+    def __init__(self, results: Optional[List[DetectionResult]] = None, parent=None):
+        super().__init__(parent)
+        self._results = results if results is not None else []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._results)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        
+        result = self._results[index.row()]
+        column = index.column()
+        detections = result.detections
+        
+        if column == 0:
+            # 画像名
+            return os.path.basename(result.image_path)
+        if column == 1:
+            # 検出数
+            return str(len(detections))
+        if column == 5:
+            return f"{result.processing_time:.2f}秒"
+        
+        # 種名（最も信頼度の高いもの）
+        if detections:
+            best = result.get_best_detection()
+            species_name = best['common_name'] if best else "不明"
+            confidence = best['confidence'] if best else 0.0
+            category = best['category'] if best else "不明"
+        else:
+            species_name = "検出なし"
+            confidence = 0.0
+            category = "-"
+        
+        if column == 2:
+            return species_name
+        if column == 3:
+            return f"{confidence:.3f}"
+        return category
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+    
+    def set_results(self, results: List[DetectionResult]):
+        """結果の差し替え"""
+        self.beginResetModel()
+        self._results = results
+        self.endResetModel()
+
+class TaskSignals(QObject):
+    """バックグラウンドタスク結果のシグナル"""
+    
+    task_completed = Signal(object)  # タスク関数の戻り値
+    task_failed = Signal(str)
+    task_progress = Signal(int, int)  # 完了数, 総数
+
+class TaskWorker(QRunnable):
+    """汎用バックグラウンドタスク（CSV出力・ファイル振り分けなどをGUIスレッド外で実行）"""
+    
+    def __init__(self, signals: TaskSignals, func: Callable, *args, **kwargs):
+        super().__init__()
+        self.signals = signals
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+    
+    def run(self):
+        """タスク実行"""
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.task_failed.emit(str(e))
+            return
+        
+        self.signals.task_completed.emit(result)
+
+def _export_all_csv(results: List[DetectionResult], output_dir: str) -> Dict[str, str]:
+    """全形式のCSV出力（TaskWorker用）"""
+    return CSVExporter(output_dir).export_all(results)
+
+def _organize_images(results: List[DetectionResult], output_dir: str,
+                     confidence_threshold: float,
+                     progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """種別フォルダへの画像振り分け（TaskWorker用）"""
+    file_manager = FileManager(output_dir)
+    return file_manager.organize_images_by_species(
+        results,
+        copy_files=True,
+        confidence_threshold=confidence_threshold,
+        progress_callback=progress_callback
+    )
 
 class MainWindow(QMainWindow):
     """メインウィンドウクラス"""
     
+    # タブ番号
+    INPUT_TAB = 0
+    PROGRESS_TAB = 1
+    RESULTS_TAB = 2
+    SETTINGS_TAB = 3
+    
+    # ログ表示の最大行数
+    MAX_LOG_LINES = 2000
+    
     def __init__(self):
         super().__init__()
         
@@ -91,9 +549,53 @@ class MainWindow(QMainWindow):
         
         # データ
         self.image_files = []
+        self._image_files_set = set()
+        
+        # ファイルサイズ取得（テーブル再構築ごとに世代を更新し古い結果を破棄）
+        self._file_list_generation = 0
+        self._file_size_signals = FileSizeSignals()
+        self._file_size_signals.sizes_ready.connect(self.update_file_sizes)
         self.results = []
         self.stats = None
-        self.processing_thread = None
+        self.processing_worker = None
+        self.folder_scan_thread = None
+        self._start_time = time.monotonic()
+        
+        # ログ表示（追加時のみ短い遅延でまとめて反映し、アイドル時はタイマーを止める）
+        self._log_queue = deque(maxlen=self.MAX_LOG_LINES)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self.flush_log)
+        
+        # 検出処理用の共有スレッドプール（実行ごとのスレッド生成を回避）
+        # 画像処理の max_workers に加え、ProcessingWorker の集約ループ用に1スレッド確保する
+        self._pool_workers = self.config.max_workers
+        self._pool = ThreadPoolExecutor(max_workers=self._pool_workers + 1)
+        
+        # CSV出力・ファイル振り分け（バックグラウンド実行）
+        self._export_running = False
+        self._export_signals = TaskSignals()
+        self._export_signals.task_completed.connect(self.export_completed)
+        self._export_signals.task_failed.connect(self.export_failed)
+        self._organize_running = False
+        self._organize_signals = TaskSignals()
+        self._organize_signals.task_completed.connect(self.organize_completed)
+        self._organize_signals.task_failed.connect(self.organize_failed)
+        self._organize_signals.task_progress.connect(self.organize_progress)
+        
+        # 初期化済みバッチ処理器（モデル読み込みを実行ごとに繰り返さない）
+        self._processor: Optional[BatchProcessor] = None
+        
+        # 設定値変更の保存を間引くタイマー（連続操作をまとめて1回だけ保存）
+        self._config_dirty_timer = QTimer(self)
+        self._config_dirty_timer.setSingleShot(True)
+        self._config_dirty_timer.setInterval(250)
+        self._config_dirty_timer.timeout.connect(self.flush_config)
+        self._config_flush_pending = False  # 処理中のため保存を保留している変更の有無
+        
+        # 適用済みテーマ（lightはスタイルシートなし）
+        self._current_theme = "light"
         
         # UI初期化
         self.init_ui()
@@ -123,11 +625,17 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
-        # タブ作成
+        # タブ作成（入力タブ以外は初めて必要になった時点で構築）
         self.create_input_tab()
-        self.create_progress_tab()
-        self.create_results_tab()
-        self.create_settings_tab()
+        self._tab_builders = {
+            self.PROGRESS_TAB: self.create_progress_tab,
+            self.RESULTS_TAB: self.create_results_tab,
+            self.SETTINGS_TAB: self.create_settings_tab,
+        }
+        self.tab_widget.addTab(QWidget(), "⏳ 処理進捗")
+        self.tab_widget.addTab(QWidget(), "📊 結果")
+        self.tab_widget.addTab(QWidget(), "⚙️ 設定")
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
         
         # ステータスバー
         self.status_bar = QStatusBar()
@@ -137,6 +645,30 @@ class MainWindow(QMainWindow):
         # ウィンドウサイズ設定
         self.resize(self.config.window_width, self.config.window_height)
     
+    def ensure_tab(self, index: int):
+        """未構築のタブを構築してプレースホルダーと差し替え"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        
+        tab = builder()
+        title = self.tab_widget.tabText(index)
+        current_index = self.tab_widget.currentIndex()
+        placeholder = self.tab_widget.widget(index)
+        
+        # 差し替え中のタブ切り替えシグナルを抑止
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, title)
+        self.tab_widget.setCurrentIndex(current_index)
+        self.tab_widget.blockSignals(False)
+        
+        placeholder.deleteLater()
+    
+    def is_tab_built(self, index: int) -> bool:
+        """タブが構築済みかどうかを確認"""
+        return index not in self._tab_builders
+    
     def create_menu_bar(self):
         """メニューバー作成"""
         menubar = self.menuBar()
@@ -207,44 +739,14 @@ class MainWindow(QMainWindow):
         # 処理開始ボタン
         self.start_btn = QPushButton("▶️ 検出処理開始")
         self.start_btn.clicked.connect(self.start_processing)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.start_btn.setStyleSheet(START_BUTTON_QSS)
         toolbar.addWidget(self.start_btn)
         
         # 処理停止ボタン
         self.stop_btn = QPushButton("⏹️ 処理停止")
         self.stop_btn.clicked.connect(self.stop_processing)
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.stop_btn.setStyleSheet(STOP_BUTTON_QSS)
         toolbar.addWidget(self.stop_btn)
     
     def create_input_tab(self):
@@ -305,12 +807,14 @@ class MainWindow(QMainWindow):
         self.confidence_spinbox.setRange(0.0, 1.0)
         self.confidence_spinbox.setSingleStep(0.1)
         self.confidence_spinbox.setValue(self.config.confidence_threshold)
+        self.confidence_spinbox.valueChanged.connect(self._config_dirty_timer.start)
         detection_layout.addWidget(self.confidence_spinbox, 0, 1)
         
         detection_layout.addWidget(QLabel("バッチサイズ:"), 1, 0)
         self.batch_size_spinbox = QSpinBox()
         self.batch_size_spinbox.setRange(1, 128)
         self.batch_size_spinbox.setValue(self.config.batch_size)
+        self.batch_size_spinbox.valueChanged.connect(self._config_dirty_timer.start)
         detection_layout.addWidget(self.batch_size_spinbox, 1, 1)
         
         detection_layout.addWidget(QLabel("最大ワーカー数:"), 2, 0)
@@ -329,17 +833,16 @@ class MainWindow(QMainWindow):
         files_group = QGroupBox("選択された画像ファイル")
         files_layout = QVBoxLayout(files_group)
         
-        self.files_table = QTableWidget()
-        self.files_table.setColumnCount(3)
-        self.files_table.setHorizontalHeaderLabels(["ファイル名", "パス", "サイズ"])
+        self.files_model = FilesModel(self.image_files, self)
+        self.files_table = QTableView()
+        self.files_table.setModel(self.files_model)
         files_layout.addWidget(self.files_table)
         
         layout.addWidget(files_group)
     
-    def create_progress_tab(self):
+    def create_progress_tab(self) -> QWidget:
         """進捗タブ"""
         tab = QWidget()
-        self.tab_widget.addTab(tab, "⏳ 処理進捗")
         
         layout = QVBoxLayout(tab)
         
@@ -363,9 +866,10 @@ class MainWindow(QMainWindow):
         log_group = QGroupBox("処理ログ")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(200)
+        self.log_text.document().setMaximumBlockCount(self.MAX_LOG_LINES)
         log_layout.addWidget(self.log_text)
         
         layout.addWidget(log_group)
@@ -382,19 +886,22 @@ class MainWindow(QMainWindow):
             ("平均処理時間", "avg_time")
         ]
         
+        # 値ラベルのスタイルはグループに1つだけ設定（ラベルごとのQSS解析を避ける）
+        stats_group.setStyleSheet(STATS_VALUE_QSS)
         for i, (name, key) in enumerate(stats_items):
             stats_layout.addWidget(QLabel(f"{name}:"), i // 2, (i % 2) * 2)
             label = QLabel("0")
-            label.setStyleSheet("font-weight: bold; color: #2196F3;")
+            label.setObjectName("statsValue")
             self.stats_labels[key] = label
             stats_layout.addWidget(label, i // 2, (i % 2) * 2 + 1)
         
         layout.addWidget(stats_group)
+        
+        return tab
     
-    def create_results_tab(self):
+    def create_results_tab(self) -> QWidget:
         """結果タブ"""
         tab = QWidget()
-        self.tab_widget.addTab(tab, "📊 結果")
         
         layout = QVBoxLayout(tab)
         
@@ -412,10 +919,11 @@ class MainWindow(QMainWindow):
             ("平均処理時間", "average_time_per_image")
         ]
         
+        summary_group.setStyleSheet(SUMMARY_VALUE_QSS)
         for i, (name, key) in enumerate(summary_items):
             summary_layout.addWidget(QLabel(f"{name}:"), i // 3, (i % 3) * 2)
             label = QLabel("-")
-            label.setStyleSheet("font-weight: bold;")
+            label.setObjectName("summaryValue")
             self.summary_labels[key] = label
             summary_layout.addWidget(label, i // 3, (i % 3) * 2 + 1)
         
@@ -428,24 +936,22 @@ class MainWindow(QMainWindow):
         # 結果操作ボタン
         results_btn_layout = QHBoxLayout()
         
-        export_csv_btn = QPushButton("📄 CSV出力")
-        export_csv_btn.clicked.connect(self.export_csv)
-        results_btn_layout.addWidget(export_csv_btn)
+        self.export_csv_btn = QPushButton("📄 CSV出力")
+        self.export_csv_btn.clicked.connect(self.export_csv)
+        results_btn_layout.addWidget(self.export_csv_btn)
         
-        organize_files_btn = QPushButton("📁 ファイル振り分け")
-        organize_files_btn.clicked.connect(self.organize_files)
-        results_btn_layout.addWidget(organize_files_btn)
+        self.organize_files_btn = QPushButton("📁 ファイル振り分け")
+        self.organize_files_btn.clicked.connect(self.organize_files)
+        results_btn_layout.addWidget(self.organize_files_btn)
         
         results_btn_layout.addStretch()
         
         results_layout.addLayout(results_btn_layout)
         
         # 結果テーブル
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels([
-            "画像", "検出数", "種名", "信頼度", "カテゴリ", "処理時間"
-        ])
+        self.results_model = ResultsModel(parent=self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         results_layout.addWidget(self.results_table)
         
         layout.addWidget(results_group)
@@ -457,14 +963,16 @@ class MainWindow(QMainWindow):
         self.species_table = QTableWidget()
         self.species_table.setColumnCount(3)
         self.species_table.setHorizontalHeaderLabels(["種名", "検出数", "平均信頼度"])
+        self.species_table.setSortingEnabled(True)
         species_layout.addWidget(self.species_table)
         
         layout.addWidget(species_group)
+        
+        return tab
     
-    def create_settings_tab(self):
+    def create_settings_tab(self) -> QWidget:
         """設定タブ"""
         tab = QWidget()
-        self.tab_widget.addTab(tab, "⚙️ 設定")
         
         layout = QVBoxLayout(tab)
         
@@ -528,34 +1036,35 @@ class MainWindow(QMainWindow):
         layout.addLayout(settings_btn_layout)
         
         layout.addStretch()
+        
+        return tab
     
     def apply_config(self):
         """設定をUIに適用"""
         self.resize(self.config.window_width, self.config.window_height)
         
-        # テーマ適用（簡易版）
-        if self.config.theme == "dark":
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QWidget {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QGroupBox {
-                    border: 2px solid #555;
-                    border-radius: 5px;
-                    margin-top: 1ex;
-                    color: #ffffff;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px 0 5px;
-                }
-            """)
+        # テーマ適用（簡易版）: テーマが変わった場合のみスタイルシートを再適用
+        if self.config.theme != self._current_theme:
+            self.setStyleSheet(DARK_QSS if self.config.theme == "dark" else "")
+            self._current_theme = self.config.theme
+    
+    def update_ui_from_config(self):
+        """設定をウィジェットに反映"""
+        # 入力・設定タブ
+        self.output_path_edit.setText(self.config.default_output_directory)
+        self.confidence_spinbox.setValue(self.config.confidence_threshold)
+        self.batch_size_spinbox.setValue(self.config.batch_size)
+        self.workers_spinbox.setValue(self.config.max_workers)
+        self.gpu_checkbox.setChecked(self.config.use_gpu)
+        
+        # 設定タブ（未構築の場合は構築時に設定から初期化される）
+        if self.is_tab_built(self.SETTINGS_TAB):
+            self.theme_combo.setCurrentText(self.config.theme)
+            self.language_combo.setCurrentText(self.config.language)
+            self.auto_save_checkbox.setChecked(self.config.auto_save_results)
+            self.memory_spinbox.setValue(self.config.memory_limit_gb)
+            self.max_image_size_spinbox.setValue(self.config.max_image_size_mb)
+            self.resize_images_checkbox.setChecked(self.config.resize_large_images)
     
     def select_image_files(self):
         """画像ファイル選択"""
@@ -568,8 +1077,7 @@ class MainWindow(QMainWindow):
         )
         
         if files:
-            self.image_files.extend(files)
-            self.update_file_list()
+            self.update_file_list(self.add_image_files(files))
             logger.info(f"{len(files)} 個のファイルを選択しました")
     
     def select_image_folder(self):
@@ -577,21 +1085,27 @@ class MainWindow(QMainWindow):
         folder = QFileDialog.getExistingDirectory(self, "画像フォルダを選択")
         
         if folder:
-            # フォルダ内の画像ファイルを検索
-            folder_path = Path(folder)
-            supported_exts = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
-            
-            found_files = []
-            for file_path in folder_path.rglob('*'):
-                if file_path.suffix.lower() in supported_exts:
-                    found_files.append(str(file_path))
+            if self.folder_scan_thread and self.folder_scan_thread.isRunning():
+                QMessageBox.information(self, "情報", "フォルダを検索中です。しばらくお待ちください。")
+                return
             
-            if found_files:
-                self.image_files.extend(found_files)
-                self.update_file_list()
-                logger.info(f"フォルダから {len(found_files)} 個のファイルを発見しました")
-            else:
-                QMessageBox.information(self, "情報", "選択されたフォルダに画像ファイルが見つかりませんでした。")
+            # フォルダ内の画像ファイルをバックグラウンドで検索
+            self.status_bar.showMessage("フォルダを検索中...")
+            self.folder_scan_thread = FolderScanThread(
+                folder, SUPPORTED_EXTENSIONS, self.config.max_workers
+            )
+            self.folder_scan_thread.files_found.connect(self.folder_scan_completed)
+            self.folder_scan_thread.start()
+    
+    def folder_scan_completed(self, found_files: List[str], sizes: List[int]):
+        """フォルダ検索完了"""
+        self.status_bar.showMessage("準備完了")
+        
+        if found_files:
+            self.update_file_list(self.add_image_files(found_files, sizes))
+            logger.info(f"フォルダから {len(found_files)} 個のファイルを発見しました")
+        else:
+            QMessageBox.information(self, "情報", "選択されたフォルダに画像ファイルが見つかりませんでした。")
     
     def select_output_folder(self):
         """出力フォルダ選択"""
@@ -601,14 +1115,36 @@ class MainWindow(QMainWindow):
     
     def clear_selection(self):
         """選択クリア"""
-        self.image_files.clear()
+        self.files_model.clear_files()
+        self._image_files_set.clear()
         self.update_file_list()
     
-    def update_file_list(self):
-        """ファイルリスト更新"""
-        # 重複除去
-        self.image_files = list(set(self.image_files))
+    def add_image_files(self, files: List[str], sizes: Optional[List[int]] = None) -> List[str]:
+        """
+        未登録の画像ファイルのみを追加（追加されたファイルを返す）
         
+        Args:
+            files: 画像ファイルパス
+            sizes: 走査時に取得済みのサイズ（filesと同順、Noneの場合は後で取得）
+        """
+        if sizes is None:
+            added = [f for f in dict.fromkeys(files) if f not in self._image_files_set]
+            added_sizes = None
+        else:
+            known = dict(zip(files, sizes))
+            added = [f for f in known if f not in self._image_files_set]
+            added_sizes = [known[f] for f in added]
+        self._image_files_set.update(added)
+        self.files_model.append_files(added, added_sizes)
+        return added
+    
+    def update_file_list(self, added: Optional[List[str]] = None):
+        """
+        ファイルリスト更新
+        
+        Args:
+            added: 追加されたファイル（Noneの場合は全行の未取得サイズを取得）
+        """
         # ラベル更新
         if self.image_files:
             self.selected_files_label.setText(f"{len(self.image_files)} 個のファイルが選択されています")
@@ -617,28 +1153,29 @@ class MainWindow(QMainWindow):
             self.selected_files_label.setText("ファイルが選択されていません")
             self.selected_files_label.setStyleSheet("color: #666; font-style: italic;")
         
-        # テーブル更新
-        self.files_table.setRowCount(len(self.image_files))
-        for i, file_path in enumerate(self.image_files):
-            path = Path(file_path)
-            
-            # ファイル名
-            self.files_table.setItem(i, 0, QTableWidgetItem(path.name))
-            
-            # パス
-            self.files_table.setItem(i, 1, QTableWidgetItem(str(path)))
-            
-            # サイズ
-            try:
-                size_mb = path.stat().st_size / (1024 * 1024)
-                size_text = f"{size_mb:.2f} MB"
-            except:
-                size_text = "不明"
-            self.files_table.setItem(i, 2, QTableWidgetItem(size_text))
+        # 未取得のサイズのみバックグラウンドで取得（フォルダ走査分は取得済み）
+        if added is None:
+            self._file_list_generation += 1
+            start_row = 0
+        else:
+            start_row = len(self.image_files) - len(added)
+        
+        pending_rows = self.files_model.pending_size_rows(start_row)
+        if pending_rows:
+            QThreadPool.globalInstance().start(FileSizeWorker(
+                pending_rows, self._file_list_generation, self._file_size_signals
+            ))
         
         # 処理開始ボタンの有効/無効
         self.start_btn.setEnabled(len(self.image_files) > 0)
     
+    def update_file_sizes(self, generation: int, sizes: list):
+        """ファイルサイズ列の更新"""
+        if generation != self._file_list_generation:
+            return
+        
+        self.files_model.set_sizes(sizes)
+    
     def start_processing(self):
         """処理開始"""
         if not self.image_files:
@@ -649,39 +1186,93 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "出力フォルダが選択されていません。")
             return
         
+        # 停止した前回の処理が画像を処理中の間は開始しない（処理器を共有するため）
+        if self.processing_worker and self.processing_worker.is_running():
+            QMessageBox.warning(self, "警告", "前回の処理の停止を待っています。しばらくしてから再度開始してください。")
+            return
+        
         # 設定更新
         self.update_config_from_ui()
         
         # UI状態更新
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
-        self.tab_widget.setCurrentIndex(1)  # 進捗タブに切り替え
+        self.tab_widget.setCurrentIndex(self.PROGRESS_TAB)  # 進捗タブに切り替え
         
         # ログクリア
-        self.log_text.clear()
+        self.clear_log()
         self.add_log("検出処理を開始します...")
+        self._start_time = time.monotonic()
         
-        # 処理スレッド開始
-        self.processing_thread = ProcessingThread(self.image_files, self.config)
-        self.processing_thread.progress_updated.connect(self.update_progress)
-        self.processing_thread.processing_completed.connect(self.processing_completed)
-        self.processing_thread.processing_error.connect(self.processing_error)
-        self.processing_thread.start()
+        # ワーカー数が変更された場合のみスレッドプールを作り直す
+        if self._pool_workers != self.config.max_workers:
+            self._pool.shutdown(wait=False)
+            self._pool_workers = self.config.max_workers
+            self._pool = ThreadPoolExecutor(max_workers=self._pool_workers + 1)
+        
+        processor = self.get_processor()
+        if processor is None:
+            self.processing_error("バッチ処理器の初期化に失敗しました")
+            return
+        
+        # 処理ワーカー開始
+        # シグナルはワーカーを束縛して接続し、古いワーカーからの通知を区別する
+        worker = ProcessingWorker(self.image_files, processor, self._pool)
+        self.processing_worker = worker
+        signals = worker.signals
+        signals.progress_updated.connect(
+            lambda current, total, status, filename, w=worker:
+                self.update_progress(current, total, status, filename, w)
+        )
+        signals.processing_completed.connect(
+            lambda results, stats, w=worker: self.processing_completed(results, stats, w)
+        )
+        signals.processing_error.connect(
+            lambda error_message, w=worker: self.processing_error(error_message, w)
+        )
+        signals.processing_finished.connect(lambda w=worker: self.processing_finished(w))
+        worker.start()
         
         logger.info("バッチ処理開始")
     
+    def get_processor(self) -> Optional[BatchProcessor]:
+        """初期化済みバッチ処理器の取得（設定オブジェクトが変わった場合のみ再作成）"""
+        # 前回の処理が使用中の処理器は破棄も再利用もしない
+        if self.processing_worker and self.processing_worker.is_running():
+            logger.warning("前回の処理が終了していないため処理器を取得できません")
+            return None
+        
+        if self._processor is not None and self._processor.config is not self.config:
+            self._processor.cleanup()
+            self._processor = None
+        
+        if self._processor is None:
+            processor = BatchProcessor(self.config)
+            if not processor.initialize():
+                return None
+            self._processor = processor
+        
+        # BatchProcessor は生成時に処理設定を複製するため、再利用時は最新の設定値を反映する
+        # （設定は update_config_from_ui で同じオブジェクトが書き換えられる）
+        self._processor.batch_size = self.config.batch_size
+        self._processor.max_workers = self.config.max_workers
+        
+        return self._processor
+    
     def stop_processing(self):
         """処理停止"""
-        if self.processing_thread and self.processing_thread.isRunning():
+        if self.processing_worker and self.processing_worker.is_running():
             self.add_log("処理停止を要求しています...")
-            self.processing_thread.cancel_processing()
+            self.stop_btn.setEnabled(False)
             
-            # スレッド終了待機（最大5秒）
-            if not self.processing_thread.wait(5000):
-                self.processing_thread.terminate()
-                self.add_log("処理を強制終了しました")
-            else:
-                self.add_log("処理が正常に停止されました")
+            # 未着手のタスクを取り消し（実行中の画像は完了後に破棄）
+            # 停止完了は processing_finished シグナルで通知されるためGUIはブロックしない
+            worker = self.processing_worker
+            worker.cancel_processing()
+            QTimer.singleShot(5000, lambda: self.stop_timed_out(worker))
+            
+            logger.info("バッチ処理停止要求")
+            return
         
         # UI状態復元
         self.start_btn.setEnabled(True)
@@ -689,6 +1280,33 @@ class MainWindow(QMainWindow):
         
         logger.info("バッチ処理停止")
     
+    def stop_timed_out(self, worker: ProcessingWorker):
+        """停止要求から一定時間経過しても処理が終わらない場合"""
+        if worker is self.processing_worker and worker.is_running():
+            # 開始ボタンは実行中の画像の処理が終わり processing_finished を受けてから有効化する
+            self.add_log("実行中の画像の処理完了を待っています...")
+    
+    def is_stale_worker(self, worker: Optional[ProcessingWorker]) -> bool:
+        """現在のワーカー以外（停止済みの古いワーカー）からの通知かどうか"""
+        return worker is not None and worker is not self.processing_worker
+    
+    def processing_finished(self, worker: Optional[ProcessingWorker] = None):
+        """処理ワーカー終了（完了・エラー・キャンセル共通）"""
+        if self.is_stale_worker(worker):
+            return
+        
+        if self.processing_worker and self.processing_worker.is_cancelled:
+            self.add_log("処理が正常に停止されました")
+            logger.info("バッチ処理停止")
+        
+        # UI状態復元
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        
+        # 処理中に保留した設定変更を保存
+        if self._config_flush_pending:
+            self.flush_config()
+    
     def update_config_from_ui(self):
         """UIから設定更新"""
         self.config.confidence_threshold = self.confidence_spinbox.value()
@@ -697,11 +1315,32 @@ class MainWindow(QMainWindow):
         self.config.use_gpu = self.gpu_checkbox.isChecked()
         self.config.default_output_directory = self.output_path_edit.text()
     
-    def update_progress(self, current: int, total: int, status: str, filename: str):
+    def apply_debounced_settings(self):
+        """保存を間引いている検出設定（信頼度閾値・バッチサイズ）のみを設定に反映"""
+        self._config_flush_pending = False
+        self.config.confidence_threshold = self.confidence_spinbox.value()
+        self.config.batch_size = self.batch_size_spinbox.value()
+    
+    def flush_config(self):
+        """検出設定の変更を反映して保存"""
+        # 処理中は検出器が画像ごとに設定を参照するため、終了後まで反映を保留する
+        if self.processing_worker and self.processing_worker.is_running():
+            self._config_flush_pending = True
+            return
+        
+        self.apply_debounced_settings()
+        self.config_manager.save_config()
+    
+    def update_progress(self, current: int, total: int, status: str, filename: str,
+                        worker: Optional[ProcessingWorker] = None):
         """進捗更新"""
+        if self.is_stale_worker(worker):
+            return
+        
         if total > 0:
             percentage = (current / total) * 100
-            self.progress_bar.setValue(int(percentage))
+            if int(percentage) != self.progress_bar.value():
+                self.progress_bar.setValue(int(percentage))
             self.progress_label.setText(f"{status} ({current}/{total}) - {percentage:.1f}%")
         
         if filename:
@@ -712,12 +1351,17 @@ class MainWindow(QMainWindow):
         
         if current > 0:
             # 簡易統計（実際の値は処理完了時に更新）
-            elapsed_time = time.time() - getattr(self, '_start_time', time.time())
-            avg_time = elapsed_time / current if current > 0 else 0
-            self.stats_labels["avg_time"].setText(f"{avg_time:.2f}秒")
+            elapsed_time = time.monotonic() - self._start_time
+            avg_time_text = f"{elapsed_time / current:.2f}秒"
+            if avg_time_text != self.stats_labels["avg_time"].text():
+                self.stats_labels["avg_time"].setText(avg_time_text)
     
-    def processing_completed(self, results: List[DetectionResult], stats: ProcessingStats):
+    def processing_completed(self, results: List[DetectionResult], stats: ProcessingStats,
+                             worker: Optional[ProcessingWorker] = None):
         """処理完了"""
+        if self.is_stale_worker(worker):
+            return
+        
         self.results = results
         self.stats = stats
         
@@ -729,7 +1373,7 @@ class MainWindow(QMainWindow):
         self.update_results_display()
         
         # 結果タブに切り替え
-        self.tab_widget.setCurrentIndex(2)
+        self.tab_widget.setCurrentIndex(self.RESULTS_TAB)
         
         # 完了メッセージ
         stats_dict = stats.to_dict()
@@ -739,13 +1383,27 @@ class MainWindow(QMainWindow):
                   f"総検出数: {stats_dict['total_detections']}\n"
                   f"処理時間: {stats_dict['processing_time']:.2f}秒")
         
-        QMessageBox.information(self, "処理完了", message)
+        # 非モーダルで表示（結果テーブルをすぐに操作できるようにする）
+        message_box = QMessageBox(QMessageBox.Information, "処理完了", message, QMessageBox.Ok, self)
+        message_box.setAttribute(Qt.WA_DeleteOnClose)
+        message_box.setModal(False)
+        message_box.show()
+        
+        self.status_bar.showMessage(
+            f"処理完了: {stats_dict['processed_images']}/{stats_dict['total_images']}枚, "
+            f"総検出数 {stats_dict['total_detections']}, "
+            f"{stats_dict['processing_time']:.2f}秒",
+            10000
+        )
         
         self.add_log("処理が完了しました")
         logger.info("バッチ処理完了")
     
-    def processing_error(self, error_message: str):
+    def processing_error(self, error_message: str, worker: Optional[ProcessingWorker] = None):
         """処理エラー"""
+        if self.is_stale_worker(worker):
+            return
+        
         # UI状態復元
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -761,6 +1419,8 @@ class MainWindow(QMainWindow):
         if not self.results or not self.stats:
             return
         
+        self.ensure_tab(self.RESULTS_TAB)
+        
         # サマリー更新
         stats_dict = self.stats.to_dict()
         self.summary_labels["total_images"].setText(str(stats_dict['total_images']))
@@ -770,53 +1430,42 @@ class MainWindow(QMainWindow):
         self.summary_labels["processing_time"].setText(f"{stats_dict['processing_time']:.2f}秒")
         self.summary_labels["average_time_per_image"].setText(f"{stats_dict['average_time_per_image']:.3f}秒")
         
-        # 結果テーブル更新
-        self.results_table.setRowCount(len(self.results))
-        for i, result in enumerate(self.results):
-            path = Path(result.image_path)
-            
-            # 画像名
-            self.results_table.setItem(i, 0, QTableWidgetItem(path.name))
-            
-            # 検出数
-            detection_count = len(result.detections)
-            self.results_table.setItem(i, 1, QTableWidgetItem(str(detection_count)))
-            
-            # 種名（最も信頼度の高いもの）
-            if result.detections:
-                best = result.get_best_detection()
-                species_name = best['common_name'] if best else "不明"
-                confidence = best['confidence'] if best else 0.0
-                category = best['category'] if best else "不明"
-            else:
-                species_name = "検出なし"
-                confidence = 0.0
-                category = "-"
-            
-            self.results_table.setItem(i, 2, QTableWidgetItem(species_name))
-            self.results_table.setItem(i, 3, QTableWidgetItem(f"{confidence:.3f}"))
-            self.results_table.setItem(i, 4, QTableWidgetItem(category))
-            self.results_table.setItem(i, 5, QTableWidgetItem(f"{result.processing_time:.2f}秒"))
+        # 結果テーブル更新（セルはビューが必要とした時点で生成）
+        self.results_model.set_results(self.results)
         
         # 種別統計テーブル更新
         species_counts = stats_dict.get('species_counts', {})
+        # 一括設定中は行の並べ替えとシグナル通知を止める（終了後に元の状態へ戻す）
+        sorting_enabled = self.species_table.isSortingEnabled()
+        self.species_table.setUpdatesEnabled(False)
+        self.species_table.setSortingEnabled(False)
+        self.species_table.blockSignals(True)
         self.species_table.setRowCount(len(species_counts))
         
+        # 種別の信頼度を一括集計
+        conf_by_species = defaultdict(list)
+        for result in self.results:
+            for detection in result.detections:
+                conf_by_species[detection['common_name']].append(detection['confidence'])
+        
+        set_item = self.species_table.setItem
+        make_item = QTableWidgetItem
         for i, (species, count) in enumerate(sorted(species_counts.items(), 
                                                   key=lambda x: x[1], 
                                                   reverse=True)):
-            self.species_table.setItem(i, 0, QTableWidgetItem(species))
-            self.species_table.setItem(i, 1, QTableWidgetItem(str(count)))
-            
-            # 平均信頼度計算（簡易版）
-            confidences = []
-            for result in self.results:
-                for detection in result.detections:
-                    if detection['common_name'] == species:
-                        confidences.append(detection['confidence'])
+            set_item(i, 0, make_item(species))
+            count_item = make_item()
+            count_item.setData(Qt.DisplayRole, count)  # 数値として並べ替え
+            set_item(i, 1, count_item)
             
+            # 平均信頼度
+            confidences = conf_by_species.get(species, ())
             avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-            self.species_table.setItem(i, 2, QTableWidgetItem(f"{avg_confidence:.3f}"))
+            set_item(i, 2, make_item(f"{avg_confidence:.3f}"))
+        
+        self.species_table.blockSignals(False)
+        self.species_table.setSortingEnabled(sorting_enabled)
+        self.species_table.setUpdatesEnabled(True)
     
     def export_csv(self):
         """CSV出力"""
@@ -824,23 +1473,42 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "出力する結果がありません。")
             return
         
-        try:
-            output_dir = self.output_path_edit.text() or str(Path.home() / "WildlifeDetector")
-            exporter = CSVExporter(output_dir)
-            
-            output_files = exporter.export_all(self.results, self.stats)
-            
-            message = "CSV出力が完了しました！\n\n"
-            for file_type, file_path in output_files.items():
-                message += f"• {Path(file_path).name}\n"
-            
-            QMessageBox.information(self, "CSV出力完了", message)
-            
-            self.add_log("CSV出力が完了しました")
-            
-        except Exception as e:
-            QMessageBox.critical(self, "CSV出力エラー", f"CSV出力中にエラーが発生しました:\n\n{str(e)}")
-            logger.error(f"CSV出力エラー: {str(e)}")
+        if self._export_running:
+            return
+        
+        # CSV書き込みはバックグラウンドで実行
+        output_dir = self.output_path_edit.text() or str(Path.home() / "WildlifeDetector")
+        self._export_running = True
+        self.ensure_tab(self.RESULTS_TAB)
+        self.export_csv_btn.setEnabled(False)
+        self.status_bar.showMessage("CSV出力中...")
+        
+        QThreadPool.globalInstance().start(
+            TaskWorker(self._export_signals, _export_all_csv, list(self.results), output_dir)
+        )
+    
+    def export_completed(self, output_files: dict):
+        """CSV出力完了"""
+        self._export_running = False
+        self.export_csv_btn.setEnabled(True)
+        self.status_bar.showMessage("準備完了")
+        
+        message = "CSV出力が完了しました！\n\n"
+        for file_type, file_path in output_files.items():
+            message += f"• {Path(file_path).name}\n"
+        
+        QMessageBox.information(self, "CSV出力完了", message)
+        
+        self.add_log("CSV出力が完了しました")
+    
+    def export_failed(self, error_message: str):
+        """CSV出力エラー"""
+        self._export_running = False
+        self.export_csv_btn.setEnabled(True)
+        self.status_bar.showMessage("準備完了")
+        
+        QMessageBox.critical(self, "CSV出力エラー", f"CSV出力中にエラーが発生しました:\n\n{error_message}")
+        logger.error(f"CSV出力エラー: {error_message}")
     
     def organize_files(self):
         """ファイル振り分け"""
@@ -848,41 +1516,61 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "振り分ける結果がありません。")
             return
         
-        try:
+        if self._organize_running:
+            return
+        
+        # 確認ダイアログ
+        reply = QMessageBox.question(
+            self, 
+            "ファイル振り分け確認",
+            "画像ファイルを種別フォルダに振り分けますか？\n\n"
+            "※ファイルはコピーされます（元ファイルは残ります）",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            # ファイルのコピーはバックグラウンドで実行
             output_dir = self.output_path_edit.text() or str(Path.home() / "WildlifeDetector")
-            file_manager = FileManager(output_dir)
+            self._organize_running = True
+            self.ensure_tab(self.RESULTS_TAB)
+            self.organize_files_btn.setEnabled(False)
+            self.status_bar.showMessage("ファイル振り分け中...")
             
-            # 確認ダイアログ
-            reply = QMessageBox.question(
-                self, 
-                "ファイル振り分け確認",
-                "画像ファイルを種別フォルダに振り分けますか？\n\n"
-                "※ファイルはコピーされます（元ファイルは残ります）",
-                QMessageBox.Yes | QMessageBox.No
-            )
+            QThreadPool.globalInstance().start(TaskWorker(
+                self._organize_signals, _organize_images,
+                list(self.results), output_dir, self.confidence_spinbox.value(),
+                progress_callback=self._organize_signals.task_progress.emit
+            ))
+    
+    def organize_progress(self, completed: int, total: int):
+        """ファイル振り分け進捗"""
+        self.status_bar.showMessage(f"ファイル振り分け中... {completed}/{total}")
+    
+    def organize_completed(self, result: dict):
+        """ファイル振り分け完了"""
+        self._organize_running = False
+        self.organize_files_btn.setEnabled(True)
+        self.status_bar.showMessage("準備完了")
+        
+        if result['success']:
+            message = (f"ファイル振り分けが完了しました！\n\n"
+                      f"処理済み: {result['processed_images']}/{result['total_images']}\n"
+                      f"種別フォルダ数: {len(result['species_folders'])}\n"
+                      f"出力ディレクトリ: {Path(result['output_directory']).name}")
             
-            if reply == QMessageBox.Yes:
-                confidence_threshold = self.confidence_spinbox.value()
-                result = file_manager.organize_images_by_species(
-                    self.results, 
-                    copy_files=True,
-                    confidence_threshold=confidence_threshold
-                )
-                
-                if result['success']:
-                    message = (f"ファイル振り分けが完了しました！\n\n"
-                              f"処理済み: {result['processed_images']}/{result['total_images']}\n"
-                              f"種別フォルダ数: {len(result['species_folders'])}\n"
-                              f"出力ディレクトリ: {Path(result['output_directory']).name}")
-                    
-                    QMessageBox.information(self, "振り分け完了", message)
-                    self.add_log("ファイル振り分けが完了しました")
-                else:
-                    QMessageBox.critical(self, "振り分けエラー", f"振り分け中にエラーが発生しました:\n\n{result.get('error', '不明なエラー')}")
+            QMessageBox.information(self, "振り分け完了", message)
+            self.add_log("ファイル振り分けが完了しました")
+        else:
+            QMessageBox.critical(self, "振り分けエラー", f"振り分け中にエラーが発生しました:\n\n{result.get('error', '不明なエラー')}")
+    
+    def organize_failed(self, error_message: str):
+        """ファイル振り分けエラー"""
+        self._organize_running = False
+        self.organize_files_btn.setEnabled(True)
+        self.status_bar.showMessage("準備完了")
         
-        except Exception as e:
-            QMessageBox.critical(self, "振り分けエラー", f"振り分け中にエラーが発生しました:\n\n{str(e)}")
-            logger.error(f"ファイル振り分けエラー: {str(e)}")
+        QMessageBox.critical(self, "振り分けエラー", f"振り分け中にエラーが発生しました:\n\n{error_message}")
+        logger.error(f"ファイル振り分けエラー: {error_message}")
     
     def export_results(self):
         """結果エクスポート（メニュー用）"""
@@ -907,7 +1595,7 @@ class MainWindow(QMainWindow):
             self.config.window_width = self.width()
             self.config.window_height = self.height()
             
-            # 設定保存
+            # 設定保存（前回保存時から変更がなければConfigManagerが書き込みを省略）
             if self.config_manager.save_config():
                 QMessageBox.information(self, "設定保存", "設定が保存されました。")
                 self.add_log("設定が保存されました")
@@ -930,6 +1618,7 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             if self.config_manager.reset_to_default():
                 self.config = self.config_manager.get_config()
+                self.update_ui_from_config()
                 self.apply_config()
                 QMessageBox.information(self, "設定リセット", "設定がデフォルトにリセットされました。")
                 self.add_log("設定がリセットされました")
@@ -961,20 +1650,37 @@ class MainWindow(QMainWindow):
         QMessageBox.about(self, "Wildlife Detectorについて", about_text)
     
     def add_log(self, message: str):
-        """ログメッセージ追加"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}"
-        self.log_text.append(log_message)
+        """ログメッセージ追加（表示はタイマーでまとめて反映）"""
+        timestamp = time.strftime("%H:%M:%S")
+        self._log_queue.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def flush_log(self):
+        """保留中のログメッセージを一括で表示"""
+        if not self._log_queue:
+            return
+        
+        self.ensure_tab(self.PROGRESS_TAB)
+        messages = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        self.log_text.appendPlainText(messages)
         
         # 自動スクロール
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def clear_log(self):
+        """ログ表示と保留中のメッセージをクリア"""
+        self._log_queue.clear()
+        self._log_timer.stop()
+        if self.is_tab_built(self.PROGRESS_TAB):
+            self.log_text.clear()
+    
     def closeEvent(self, event):
         """ウィンドウクローズイベント"""
         # 処理中の場合は確認
-        if self.processing_thread and self.processing_thread.isRunning():
+        if self.processing_worker and self.processing_worker.is_running():
             reply = QMessageBox.question(
                 self,
                 "終了確認",
@@ -989,10 +1695,21 @@ class MainWindow(QMainWindow):
             # 処理停止
             self.stop_processing()
         
-        # 設定保存
+        # 設定保存（保留中の変更も含めて1回だけ書き込み、未変更なら省略）
+        if self._config_dirty_timer.isActive() or self._config_flush_pending:
+            self._config_dirty_timer.stop()
+            self.apply_debounced_settings()
         self.config.window_width = self.width()
         self.config.window_height = self.height()
         self.config_manager.save_config()
         
+        # スレッドプール停止
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        
+        # 停止した処理が実行中の画像を処理している間は処理器を破棄しない
+        if self._processor and not (self.processing_worker and self.processing_worker.is_running()):
+            self._processor.cleanup()
+            self._processor = None
+        
         event.accept()
         logger.info("アプリケーション終了")
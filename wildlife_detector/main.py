@@ -7,6 +7,7 @@ Google SpeciesNetを使用した高精度な鳥類・哺乳類検出
 
 import sys
 import os
+import importlib.util
 import logging
 from pathlib import Path
 
@@ -65,11 +66,11 @@ class WildlifeDetectorApp:
             'cv2': 'opencv-python'
         }
         
+        # インストール有無のみ確認（pandas等の重いモジュールを起動時に読み込まない）
         for module, package in required_packages.items():
-            try:
-                __import__(module)
+            if importlib.util.find_spec(module) is not None:
                 self.logger.info(f"✓ {package} - OK")
-            except ImportError:
+            else:
                 missing_packages.append(package)
                 self.logger.error(f"✗ {package} - 未インストール")
         
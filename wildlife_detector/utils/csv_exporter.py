@@ -8,13 +8,74 @@ CSV Exporter - CSV出力機能
 import os
 import csv
 import logging
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from typing import List, Dict, Any, Optional, Iterator, TextIO, TYPE_CHECKING
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
+import importlib.util
 
 from ..core.species_detector import DetectionResult
 
+if TYPE_CHECKING:
+    # pandasは読み込みが重いため、使用する関数内で遅延インポートする
+    import pandas as pd
+
+# pyarrow（CSV読み込みの高速化、任意）
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# このサイズ以上のCSVはpyarrowでメモリマップして読み込む
+MMAP_READ_THRESHOLD = 50 * 1024 * 1024
+
+# CSV書き込みバッファサイズ（大きなCSVでのwrite()呼び出し回数を削減）
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 詳細結果CSVの列順
+RESULT_FIELDNAMES = (
+    'image_path', 'image_filename', 'processing_time_seconds', 'success', 'error_message',
+    'detection_id', 'species', 'scientific_name', 'common_name', 'confidence', 'category',
+    'bbox_x1', 'bbox_y1', 'bbox_x2', 'bbox_y2', 'total_detections_in_image',
+)
+
+# 結果が空の場合のヘッダー
+EMPTY_RESULT_FIELDNAMES = ('image_path', 'status', 'error_message')
+
+# サマリーCSVの列順
+SUMMARY_FIELDNAMES = ('metric', 'value', 'description')
+
+# サマリーに出力するカテゴリと表示名
+SUMMARY_CATEGORIES = (
+    ('bird', '鳥類'),
+    ('mammal', '哺乳類'),
+    ('reptile', '爬虫類'),
+    ('amphibian', '両生類'),
+)
+
+@contextmanager
+def _atomic_write(output_path: Path) -> Iterator[TextIO]:
+    """
+    一時ファイルに書き込み、完了後に出力先へ置き換える
+    
+    途中で終了しても不完全なCSVが残らないようにし、書き込み後はページキャッシュを解放する。
+    """
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 class CSVExporter:
     """CSV出力クラス"""
     
@@ -28,40 +89,57 @@ class CSVExporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
+        # export_all の実行中のみ設定される実行時刻（3ファイルで共有）
+        self._run_timestamp: Optional[str] = None
+    
+    def _timestamp(self) -> str:
+        """ファイル名用のタイムスタンプを取得"""
+        return self._run_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    def export_results(self, results: List[DetectionResult], base_filename: str = None) -> str:
+    def export_results(self, results: List[DetectionResult], base_filename: str = None,
+                       use_pandas: bool = False) -> str:
         """
         検出結果をCSVファイルに出力
         
         Args:
             results: 検出結果のリスト
             base_filename: ベースファイル名（自動生成可能）
+            use_pandas: pandasのDataFrame.to_csvで出力する場合はTrue
             
         Returns:
             str: 出力されたCSVファイルのパス
         """
         if base_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._timestamp()
             base_filename = f"wildlife_detection_results_{timestamp}.csv"
         
         output_path = self.output_dir / base_filename
         
         try:
-            # CSVデータの準備
-            csv_data = self._prepare_csv_data(results)
-            
-            # CSVファイルの書き込み
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                if csv_data:
-                    fieldnames = csv_data[0].keys()
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(csv_data)
-                else:
+            if use_pandas:
+                # pandasのCライターで一括出力
+                import pandas as pd
+                csv_data = self._prepare_csv_data(results)
+                if csv_data.empty:
                     # 空の結果の場合のヘッダー
-                    fieldnames = ['image_path', 'status', 'error_message']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
+                    csv_data = pd.DataFrame(columns=EMPTY_RESULT_FIELDNAMES)
+                with _atomic_write(output_path) as csvfile:
+                    csv_data.to_csv(csvfile, index=False, lineterminator='\r\n')
+            else:
+                # CSV行は逐次生成して書き込む（全行をメモリに保持しない）
+                rows = self._iter_csv_rows(results)
+                first_row = next(rows, None)
+                
+                # CSVファイルの書き込み
+                # csv.writer はC実装のため、固定スキーマ向けにPythonで生成した行フォーマッタより高速
+                with _atomic_write(output_path) as csvfile:
+                    writer = csv.writer(csvfile)
+                    if first_row is not None:
+                        writer.writerow(RESULT_FIELDNAMES)
+                        writer.writerows(chain((first_row,), rows))
+                    else:
+                        # 空の結果の場合のヘッダー
+                        writer.writerow(EMPTY_RESULT_FIELDNAMES)
             
             self.logger.info(f"CSV出力完了: {output_path}")
             return str(output_path)
@@ -70,56 +148,47 @@ class CSVExporter:
             self.logger.error(f"CSV出力エラー: {str(e)}")
             raise
     
-    def _prepare_csv_data(self, results: List[DetectionResult]) -> List[Dict[str, Any]]:
-        """CSVデータの準備"""
-        csv_data = []
+    def _prepare_csv_data(self, results: List[DetectionResult]) -> 'pd.DataFrame':
+        """CSVデータの準備（行タプルから一括でDataFrameを構築）"""
+        import pandas as pd
+        return pd.DataFrame.from_records(self._iter_csv_rows(results), columns=RESULT_FIELDNAMES)
+    
+    def _iter_csv_rows(self, results: List[DetectionResult]) -> Iterator[tuple]:
+        """
+        CSV行データを逐次生成（RESULT_FIELDNAMES順のタプル）
         
+        同一画像の検出行はパス・ファイル名の文字列オブジェクトを共有する（行ごとのコピーなし）。
+        """
         for result in results:
-            base_row = {
-                'image_path': result.image_path,
-                'image_filename': os.path.basename(result.image_path),
-                'processing_time_seconds': round(result.processing_time, 3),
-                'success': result.success,
-                'error_message': result.error_message if not result.success else ''
-            }
+            image_path = result.image_path
+            image_filename = os.path.basename(image_path)
+            processing_time = round(result.processing_time, 3)
+            success = result.success
+            error_message = result.error_message if not success else ''
             
-            if result.success and result.detections:
+            if success and result.detections:
                 # 検出された各個体について行を作成
-                for i, detection in enumerate(result.detections):
-                    row = base_row.copy()
-                    row.update({
-                        'detection_id': i + 1,
-                        'species': detection.get('species', ''),
-                        'scientific_name': detection.get('scientific_name', ''),
-                        'common_name': detection.get('common_name', ''),
-                        'confidence': round(detection.get('confidence', 0), 4),
-                        'category': detection.get('category', ''),
-                        'bbox_x1': detection.get('bbox', [0, 0, 0, 0])[0],
-                        'bbox_y1': detection.get('bbox', [0, 0, 0, 0])[1],
-                        'bbox_x2': detection.get('bbox', [0, 0, 0, 0])[2],
-                        'bbox_y2': detection.get('bbox', [0, 0, 0, 0])[3],
-                        'total_detections_in_image': len(result.detections),
-                    })
-                    csv_data.append(row)
+                total_detections = len(result.detections)
+                for i, detection in enumerate(result.detections, 1):
+                    get = detection.get
+                    x1, y1, x2, y2 = get('bbox') or (0, 0, 0, 0)
+                    yield (
+                        image_path, image_filename, processing_time, success, error_message,
+                        i,
+                        get('species', ''),
+                        get('scientific_name', ''),
+                        get('common_name', ''),
+                        round(get('confidence', 0), 4),
+                        get('category', ''),
+                        x1, y1, x2, y2,
+                        total_detections,
+                    )
             else:
                 # 検出されなかった場合
-                row = base_row.copy()
-                row.update({
-                    'detection_id': 0,
-                    'species': '',
-                    'scientific_name': '',
-                    'common_name': '',
-                    'confidence': 0,
-                    'category': '',
-                    'bbox_x1': 0,
-                    'bbox_y1': 0,
-                    'bbox_x2': 0,
-                    'bbox_y2': 0,
-                    'total_detections_in_image': 0,
-                })
-                csv_data.append(row)
-        
-        return csv_data
+                yield (
+                    image_path, image_filename, processing_time, success, error_message,
+                    0, '', '', '', 0, '', 0, 0, 0, 0, 0,
+                )
     
     def export_summary(self, results: List[DetectionResult], base_filename: str = None) -> str:
         """
@@ -133,7 +202,7 @@ class CSVExporter:
             str: 出力されたCSVファイルのパス
         """
         if base_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._timestamp()
             base_filename = f"wildlife_detection_summary_{timestamp}.csv"
         
         output_path = self.output_dir / base_filename
@@ -143,17 +212,10 @@ class CSVExporter:
             summary_data = self._calculate_summary(results)
             
             # CSVファイルの書き込み
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['metric', 'value', 'description']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for metric, value, description in summary_data:
-                    writer.writerow({
-                        'metric': metric,
-                        'value': value,
-                        'description': description
-                    })
+            with _atomic_write(output_path) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(SUMMARY_FIELDNAMES)
+                writer.writerows(summary_data)
             
             self.logger.info(f"サマリーCSV出力完了: {output_path}")
             return str(output_path)
@@ -168,43 +230,59 @@ class CSVExporter:
             return [('total_images', 0, '処理対象画像数')]
         
         total_images = len(results)
-        successful_images = len([r for r in results if r.success])
-        failed_images = total_images - successful_images
         
-        # 検出統計
-        images_with_detections = len([r for r in results if r.success and r.detections])
-        total_detections = sum(len(r.detections) for r in results if r.success)
-        
-        # 種統計
-        species_counter = {}
-        category_counter = {}
+        # 1回の走査で全統計を集計
+        successful_images = 0
+        images_with_detections = 0
+        total_detections = 0
+        species_counter = Counter()
+        category_counter = Counter()
+        total_processing_time = 0.0
+        processing_time_count = 0
+        confidence_sum = 0.0
+        confidence_min = float('inf')
+        confidence_max = float('-inf')
         
         for result in results:
-            if result.success and result.detections:
-                for detection in result.detections:
-                    species = detection.get('common_name', 'Unknown')
-                    category = detection.get('category', 'Unknown')
-                    
-                    species_counter[species] = species_counter.get(species, 0) + 1
-                    category_counter[category] = category_counter.get(category, 0) + 1
+            # 性能統計
+            processing_time = result.processing_time
+            if processing_time > 0:
+                total_processing_time += processing_time
+                processing_time_count += 1
+            
+            if not result.success:
+                continue
+            successful_images += 1
+            
+            detections = result.detections
+            if not detections:
+                continue
+            images_with_detections += 1
+            total_detections += len(detections)
+            
+            # 種・信頼度統計
+            for detection in detections:
+                get = detection.get
+                species_counter[get('common_name', 'Unknown')] += 1
+                category_counter[get('category', 'Unknown')] += 1
+                
+                confidence = get('confidence', 0)
+                confidence_sum += confidence
+                if confidence < confidence_min:
+                    confidence_min = confidence
+                if confidence > confidence_max:
+                    confidence_max = confidence
         
-        unique_species = len(species_counter)
-        most_common_species = max(species_counter.items(), key=lambda x: x[1])[0] if species_counter else 'N/A'
+        failed_images = total_images - successful_images
         
-        # 性能統計
-        processing_times = [r.processing_time for r in results if r.processing_time > 0]
-        avg_processing_time = sum(processing_times) / len(processing_times) if processing_times else 0
-        total_processing_time = sum(processing_times)
+        unique_species = len(species_counter)
+        most_common_species = species_counter.most_common(1)[0][0] if species_counter else 'N/A'
         
-        # 信頼度統計
-        confidences = []
-        for result in results:
-            if result.success and result.detections:
-                confidences.extend([d.get('confidence', 0) for d in result.detections])
+        avg_processing_time = total_processing_time / processing_time_count if processing_time_count else 0
         
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-        min_confidence = min(confidences) if confidences else 0
-        max_confidence = max(confidences) if confidences else 0
+        avg_confidence = confidence_sum / total_detections if total_detections else 0
+        min_confidence = confidence_min if total_detections else 0
+        max_confidence = confidence_max if total_detections else 0
         
         summary_data = [
             # 基本統計
@@ -222,13 +300,15 @@ class CSVExporter:
             # 種統計
             ('unique_species_count', unique_species, '検出された種数'),
             ('most_common_species', most_common_species, '最頻出種'),
-            
-            # カテゴリ統計
-            ('bird_detections', category_counter.get('bird', 0), '鳥類検出数'),
-            ('mammal_detections', category_counter.get('mammal', 0), '哺乳類検出数'),
-            ('reptile_detections', category_counter.get('reptile', 0), '爬虫類検出数'),
-            ('amphibian_detections', category_counter.get('amphibian', 0), '両生類検出数'),
-            
+        ]
+        
+        # カテゴリ統計（Counterは未検出カテゴリに0を返す）
+        summary_data.extend(
+            (f'{category}_detections', category_counter[category], f'{label}検出数')
+            for category, label in SUMMARY_CATEGORIES
+        )
+        
+        summary_data.extend([
             # 性能統計
             ('total_processing_time_seconds', round(total_processing_time, 2), '総処理時間（秒）'),
             ('avg_processing_time_seconds', round(avg_processing_time, 3), '平均処理時間（秒）'),
@@ -238,7 +318,7 @@ class CSVExporter:
             ('avg_confidence', round(avg_confidence, 4), '平均信頼度'),
             ('min_confidence', round(min_confidence, 4), '最低信頼度'),
             ('max_confidence', round(max_confidence, 4), '最高信頼度'),
-        ]
+        ])
         
         return summary_data
     
@@ -254,7 +334,7 @@ class CSVExporter:
             str: 出力されたCSVファイルのパス
         """
         if base_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._timestamp()
             base_filename = f"wildlife_species_list_{timestamp}.csv"
         
         output_path = self.output_dir / base_filename
@@ -264,7 +344,7 @@ class CSVExporter:
             species_stats = self._calculate_species_stats(results)
             
             # CSVファイルの書き込み
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+            with _atomic_write(output_path) as csvfile:
                 fieldnames = [
                     'common_name', 'scientific_name', 'category',
                     'detection_count', 'image_count', 'avg_confidence',
@@ -284,51 +364,57 @@ class CSVExporter:
     def _calculate_species_stats(self, results: List[DetectionResult]) -> List[Dict[str, Any]]:
         """種別統計の計算"""
         species_data = {}
+        image_counts = Counter()  # 種ごとの検出画像数
         
         for result in results:
             if result.success and result.detections:
                 image_species = set()  # この画像で検出された種（重複除去用）
                 
                 for detection in result.detections:
-                    species = detection.get('species', 'Unknown')
-                    common_name = detection.get('common_name', 'Unknown')
-                    scientific_name = detection.get('scientific_name', species)
-                    category = detection.get('category', 'Unknown')
-                    confidence = detection.get('confidence', 0)
+                    get = detection.get
+                    species = get('species', 'Unknown')
                     
-                    if species not in species_data:
-                        species_data[species] = {
-                            'common_name': common_name,
-                            'scientific_name': scientific_name,
-                            'category': category,
+                    data = species_data.get(species)
+                    if data is None:
+                        # 名称等は初出時のみ取得
+                        data = species_data[species] = {
+                            'common_name': get('common_name', 'Unknown'),
+                            'scientific_name': get('scientific_name', species),
+                            'category': get('category', 'Unknown'),
                             'detection_count': 0,
-                            'image_count': 0,
-                            'confidences': []
+                            'conf_sum': 0.0,
+                            'conf_min': float('inf'),
+                            'conf_max': float('-inf'),
                         }
                     
-                    species_data[species]['detection_count'] += 1
-                    species_data[species]['confidences'].append(confidence)
+                    # 信頼度はリストに保持せず逐次集計
+                    confidence = get('confidence', 0)
+                    data['detection_count'] += 1
+                    data['conf_sum'] += confidence
+                    if confidence < data['conf_min']:
+                        data['conf_min'] = confidence
+                    if confidence > data['conf_max']:
+                        data['conf_max'] = confidence
                     
                     # 画像カウント（1つの画像で同じ種が複数検出されても1回だけカウント）
                     image_species.add(species)
                 
                 # 画像カウントの更新
-                for species in image_species:
-                    species_data[species]['image_count'] += 1
+                image_counts.update(image_species)
         
         # 結果の整形
         species_stats = []
         for species, data in species_data.items():
-            confidences = data['confidences']
+            detection_count = data['detection_count']
             stats = {
                 'common_name': data['common_name'],
                 'scientific_name': data['scientific_name'],
                 'category': data['category'],
-                'detection_count': data['detection_count'],
-                'image_count': data['image_count'],
-                'avg_confidence': round(sum(confidences) / len(confidences), 4),
-                'min_confidence': round(min(confidences), 4),
-                'max_confidence': round(max(confidences), 4)
+                'detection_count': detection_count,
+                'image_count': image_counts[species],
+                'avg_confidence': round(data['conf_sum'] / detection_count, 4),
+                'min_confidence': round(data['conf_min'], 4),
+                'max_confidence': round(data['conf_max'], 4)
             }
             species_stats.append(stats)
         
@@ -348,24 +434,26 @@ class CSVExporter:
         Returns:
             Dict[str, str]: 出力ファイルパスの辞書
         """
+        # 3ファイルで同じタイムスタンプを共有
+        self._run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         if base_filename_prefix is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_filename_prefix = f"wildlife_detection_{timestamp}"
+            base_filename_prefix = f"wildlife_detection_{self._run_timestamp}"
         
-        output_files = {}
+        # 出力種別ごとの (出力関数, ファイル名)
+        tasks = {
+            'results': (self.export_results, f"{base_filename_prefix}_results.csv"),  # 詳細結果
+            'summary': (self.export_summary, f"{base_filename_prefix}_summary.csv"),  # サマリー
+            'species_list': (self.export_species_list, f"{base_filename_prefix}_species_list.csv"),  # 種リスト
+        }
         
         try:
-            # 詳細結果
-            details_file = f"{base_filename_prefix}_results.csv"
-            output_files['results'] = self.export_results(results, details_file)
-            
-            # サマリー
-            summary_file = f"{base_filename_prefix}_summary.csv"
-            output_files['summary'] = self.export_summary(results, summary_file)
-            
-            # 種リスト
-            species_file = f"{base_filename_prefix}_species_list.csv"
-            output_files['species_list'] = self.export_species_list(results, species_file)
+            # 3ファイルを並行して出力（書き込み中はGILが解放される）
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {
+                    key: executor.submit(export_func, results, filename)
+                    for key, (export_func, filename) in tasks.items()
+                }
+                output_files = {key: future.result() for key, future in futures.items()}
             
             self.logger.info(f"全形式CSV出力完了: {len(output_files)}ファイル")
             return output_files
@@ -373,34 +461,48 @@ class CSVExporter:
         except Exception as e:
             self.logger.error(f"CSV一括出力エラー: {str(e)}")
             raise
+        
+        finally:
+            # 以降の個別出力が古いタイムスタンプを再利用して上書きしないよう解除
+            self._run_timestamp = None
 
 class CSVAnalyzer:
     """CSV結果の分析クラス"""
     
     @staticmethod
-    def load_results(csv_path: str) -> pd.DataFrame:
-        """CSV結果ファイルを読み込み"""
+    def load_results(csv_path: str) -> 'pd.DataFrame':
+        """CSV結果ファイルを読み込み（pyarrowが利用可能な場合はマルチスレッドで解析）"""
+        import pandas as pd
+        
         try:
+            if PYARROW_AVAILABLE and os.path.getsize(csv_path) >= MMAP_READ_THRESHOLD:
+                # 大きなファイルはメモリマップ経由で読み込み（ユーザー空間へのコピーを回避）
+                # 欠損値の扱いを他の経路と揃えるため、解析はpandasのpyarrowエンジンに任せる
+                import pyarrow as pa
+                with pa.memory_map(csv_path, 'r') as source:
+                    return pd.read_csv(source, encoding='utf-8', engine='pyarrow')
+            if PYARROW_AVAILABLE:
+                return pd.read_csv(csv_path, encoding='utf-8', engine='pyarrow')
             return pd.read_csv(csv_path, encoding='utf-8')
         except Exception as e:
             logging.error(f"CSV読み込みエラー: {str(e)}")
             raise
     
     @staticmethod
-    def analyze_temporal_patterns(df: pd.DataFrame, image_path_column: str = 'image_path') -> Dict[str, Any]:
+    def analyze_temporal_patterns(df: 'pd.DataFrame', image_path_column: str = 'image_path') -> Dict[str, Any]:
         """時系列パターンの分析（ファイル名から推定）"""
         # TODO: ファイル名から撮影時刻を推定する実装
         # 例: IMG_20240101_120000.jpg のような形式の解析
         pass
     
     @staticmethod
-    def analyze_spatial_patterns(df: pd.DataFrame) -> Dict[str, Any]:
+    def analyze_spatial_patterns(df: 'pd.DataFrame') -> Dict[str, Any]:
         """空間パターンの分析（位置情報が利用可能な場合）"""
         # TODO: GPS情報が利用可能な場合の空間分析
         pass
     
     @staticmethod
-    def generate_report(df: pd.DataFrame) -> str:
+    def generate_report(df: 'pd.DataFrame') -> str:
         """分析レポートの生成"""
         report = []
         report.append("=== Wildlife Detection Analysis Report ===\\n")
@@ -3,24 +3,182 @@ Wildlife Detector - ファイル管理機能
 画像の自動振り分け、コピー、移動、リネーム機能
 """
 
+import functools
 import logging
 import shutil
 import os
+import sys
+import re
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable, Set, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from ..core.species_detector import DetectionResult
 
 logger = logging.getLogger(__name__)
 
+# フォルダ名の無害化に使う置換表と正規表現（モジュール読み込み時に1回だけ作成）
+_INVALID_FOLDER_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_MULTI_UNDERSCORE_RE = re.compile(r'_{2,}')
+
+# 並列コピーのワーカー数（I/O待ちが主体のためCPU数より多くする）
+# io_uring による一括投入は標準ライブラリから使えないため採用していない。
+# copy_file_range はファイル全体を1回のシステムコールでカーネル内コピーできるため、
+# ワーカースレッドで並列に発行するだけで I/O を十分に重ねられる。
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# sendfile で通常ファイルへ書き込めるのはLinuxのみ
+# （macOS等ではソケット宛て専用で、offset=None も受け付けない）
+_SENDFILE_SUPPORTED = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
+# copy_file_range / sendfile 1回あたりの最小コピーサイズ
+_FAST_COPY_CHUNK = 8 * 1024 * 1024
+
+# ソースフォルダを一括走査する際、結果1件あたりに読むエントリ数の上限
+# （結果がフォルダ内のごく一部なら、フォルダ全体の走査より個別のstatの方が安い）
+_SCAN_ENTRIES_PER_RESULT = 8
+
+# 通常コピーのバッファサイズ
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Windows の CopyFile2（ReFSのブロック複製やSMBのサーバー側コピーを利用できる）
+_copy_file2 = None
+if os.name == 'nt':
+    try:
+        import ctypes
+        from ctypes import wintypes
+        
+        _copy_file2 = ctypes.windll.kernel32.CopyFile2
+        _copy_file2.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p)
+        _copy_file2.restype = ctypes.c_long  # HRESULT（0: 成功）
+    except (ImportError, AttributeError, OSError):
+        _copy_file2 = None
+
+# ワーカースレッドごとのコピーバッファ
+_thread_local = threading.local()
+
+def _get_copy_buffer() -> memoryview:
+    """スレッドごとに1度だけ確保したコピーバッファを取得"""
+    buffer = getattr(_thread_local, 'copy_buffer', None)
+    if buffer is None:
+        buffer = memoryview(bytearray(_COPY_BUFFER_SIZE))
+        _thread_local.copy_buffer = buffer
+    return buffer
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int) -> bool:
+    """copy_file_range によるカーネル内コピー（CoW対応FSではreflink、NFSではサーバー側コピー）"""
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    chunk = max(size, _FAST_COPY_CHUNK)
+    copied = 0
+    try:
+        while True:
+            n = os.copy_file_range(src_fd, dst_fd, chunk)
+            if not n:
+                break
+            copied += n
+    except (OSError, TypeError):
+        # 使えない場合は次の方式へ（本当のI/Oエラーは通常コピーで改めて発生する）
+        return False
+    # 一部のFS（overlayfs・FUSE・NFS等）は初回から0を返すため、コピー量で成否を判定
+    return copied == size
+
+def _sendfile(src_fd: int, dst_fd: int, size: int) -> bool:
+    """sendfile によるカーネル内コピー（Linuxのみ）"""
+    if not _SENDFILE_SUPPORTED:
+        return False
+    chunk = max(size, _FAST_COPY_CHUNK)
+    copied = 0
+    try:
+        while True:
+            n = os.sendfile(dst_fd, src_fd, None, chunk)
+            if not n:
+                break
+            copied += n
+    except (OSError, TypeError):
+        return False
+    return copied == size
+
+def _fast_copy2(source_path: str, target_path: str, preserve: str = 'all',
+                source_stat: Optional[os.stat_result] = None):
+    """
+    shutil.copy2 相当のコピー
+    
+    Windowsでは CopyFile2（失敗時は shutil.copy2）を使う。
+    それ以外では copy_file_range → sendfile（Linuxのみ）→ 1MiBバッファの readinto の順に試し、
+    データのコピー後にメタデータを複製する。
+    
+    Args:
+        preserve: 'all' なら shutil.copystat で権限・拡張属性・日時をすべて複製、
+                  'mtime' なら os.utime で更新日時（とアクセス日時）のみ複製
+        source_stat: preserve='mtime' で使う取得済みのstat（ソースの再statを省く）
+    """
+    if _copy_file2 is not None:
+        # CopyFile2 は更新日時や属性も複製する
+        if _copy_file2(os.fspath(source_path), os.fspath(target_path), None) != 0:
+            shutil.copy2(source_path, target_path)
+        return
+    
+    # バッファなしで開き、読み書きを直接システムコールにする
+    with open(source_path, 'rb', buffering=0) as fsrc, open(target_path, 'wb', buffering=0) as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        
+        for copy_func in (_copy_file_range, _sendfile):
+            if copy_func(src_fd, dst_fd, size):
+                break
+            # 途中まで書き込まれていても先頭からやり直す
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+        else:
+            buffer = _get_copy_buffer()
+            while True:
+                n = fsrc.readinto(buffer)
+                if not n:
+                    break
+                # 非バッファ書き込みは部分書き込みがあり得るため残りを書き切る
+                written = 0
+                while written < n:
+                    written += fdst.write(buffer[written:n])
+    
+    if preserve == 'mtime':
+        if source_stat is None:
+            source_stat = os.stat(source_path)
+        os.utime(target_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    else:
+        shutil.copystat(source_path, target_path)
+
 class FileManager:
     """ファイル管理クラス"""
     
-    def __init__(self, output_directory: str):
+    PROGRESS_INTERVAL = 50  # 振り分け進捗の通知間隔（ファイル数）
+    
+    def __init__(self, output_directory: str, max_workers: Optional[int] = None,
+                 track_files: bool = False):
+        """
+        初期化
+        
+        Args:
+            output_directory: 出力ディレクトリ
+            max_workers: 並列コピーのワーカー数（省略時は COPY_WORKERS）
+            track_files: 振り分け結果の種別フォルダ情報に出力ファイルの一覧（'files'）を含めるか
+        """
         self.output_directory = Path(output_directory)
+        self.max_workers = max_workers or COPY_WORKERS
+        self.track_files = track_files
         self.output_directory.mkdir(parents=True, exist_ok=True)
         
+        # 作成済みフォルダ（同じフォルダへの mkdir を繰り返さない）
+        self._created_dirs: Set[str] = {str(self.output_directory)}
+        
+        # 重複回避用: フォルダごとの使用済みファイル名と、名前ごとの最後の連番
+        self._folder_names: Dict[str, Set[str]] = {}
+        self._collision_counters: Dict[Tuple[str, str], int] = {}
+        
         # タイムスタンプ生成
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -28,8 +186,23 @@ class FileManager:
     
     def organize_images_by_species(self, results: List[DetectionResult], 
                                  copy_files: bool = True,
-                                 confidence_threshold: float = 0.5) -> Dict[str, Any]:
-        """種別による画像の自動振り分け"""
+                                 confidence_threshold: float = 0.5,
+                                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                                 preserve: str = 'mtime') -> Dict[str, Any]:
+        """
+        種別による画像の自動振り分け
+        
+        振り分け先の決定は逐次で、振り分け先フォルダごとにまとめて行い、
+        ファイルのコピーはスレッドプールで並列に実行する。
+        移動は元ファイルが消えるため、振り分け先の決定順にメインスレッドで実行する。
+        
+        Args:
+            results: 検出結果のリスト
+            copy_files: Trueならコピー、Falseなら移動
+            confidence_threshold: 振り分けに使用する信頼度の閾値
+            progress_callback: 進捗通知 (完了数, 総数)。PROGRESS_INTERVAL 件ごとに呼ばれる
+            preserve: コピー時に複製するメタデータ（'mtime': 更新日時のみ、'all': copystat 相当）
+        """
         
         logger.info(f"画像振り分け開始: {len(results)} 枚")
         logger.info(f"コピーモード: {copy_files}, 信頼度閾値: {confidence_threshold}")
@@ -49,22 +222,48 @@ class FileManager:
         try:
             # 基本フォルダの作成
             base_folder = self.output_directory / f"organized_images_{self.timestamp}"
-            base_folder.mkdir(exist_ok=True)
+            base_folder_str = str(base_folder)  # ループ内は文字列で扱う
+            self._ensure_dir(base_folder_str)
             
             # 特別フォルダの作成
-            no_detection_folder = base_folder / "no_detection"
-            multiple_species_folder = base_folder / "multiple_species"
-            no_detection_folder.mkdir(exist_ok=True)
-            multiple_species_folder.mkdir(exist_ok=True)
+            no_detection_folder = os.path.join(base_folder_str, "no_detection")
+            multiple_species_folder = os.path.join(base_folder_str, "multiple_species")
+            self._ensure_dir(no_detection_folder)
+            self._ensure_dir(multiple_species_folder)
+            
+            # 1. 振り分け先フォルダの決定（逐次）
+            groups = {}  # 振り分け先フォルダ -> [(result, source_path, folder_name, filtered_detections, source_entry)]
+            source_dirs = {}  # ソースフォルダ -> 走査結果（フォルダごとに1回だけ走査）
+            
+            # ソースフォルダごとに探すファイル名
+            wanted_names: Dict[str, Set[str]] = {}
+            for result in results:
+                source_dir, source_name = os.path.split(result.image_path)
+                wanted_names.setdefault(source_dir, set()).add(os.path.normcase(source_name))
             
             for result in results:
                 try:
-                    # ファイル存在確認
-                    source_path = Path(result.image_path)
-                    if not source_path.exists():
+                    # ファイル存在確認（フォルダの走査結果で判定し、個別のstatを省く）
+                    source_path = result.image_path
+                    source_dir, source_name = os.path.split(source_path)
+                    if source_dir not in source_dirs:
+                        source_dirs[source_dir] = self._scan_source_dir(
+                            source_dir, wanted_names[source_dir]
+                        )
+                    dir_entries = source_dirs[source_dir]
+                    
+                    if dir_entries is None:
+                        # 走査できない・結果に対して大きすぎるフォルダは個別に確認
+                        source_entry = None
+                        source_exists = os.path.exists(source_path)
+                    else:
+                        source_entry = dir_entries.get(os.path.normcase(source_name))
+                        source_exists = source_entry is not None
+                    
+                    if not source_exists:
                         logger.warning(f"ソースファイルが見つかりません: {source_path}")
                         organization_result['error_files'].append({
-                            'file': str(source_path),
+                            'file': source_path,
                             'error': 'ファイルが見つかりません'
                         })
                         organization_result['failed_images'] += 1
@@ -82,20 +281,23 @@ class FileManager:
                     elif len(filtered_detections) == 1:
                         # 単一種検出
                         detection = filtered_detections[0]
-                        folder_name = self._sanitize_folder_name(detection.common_name)
-                        target_folder = base_folder / folder_name
-                        target_folder.mkdir(exist_ok=True)
+                        folder_name = self._sanitize_folder_name(detection.get('common_name', ''))
+                        target_folder = os.path.join(base_folder_str, folder_name)
                         
                         # 種別フォルダ記録
                         if folder_name not in organization_result['species_folders']:
-                            organization_result['species_folders'][folder_name] = {
-                                'species_name': detection.common_name,
-                                'scientific_name': detection.scientific_name,
-                                'category': detection.category,
+                            folder_info = {
+                                'species_name': detection.get('common_name', ''),
+                                'scientific_name': detection.get('scientific_name', ''),
+                                'category': detection.get('category', ''),
                                 'file_count': 0,
                                 'avg_confidence': 0.0,
-                                'files': []
+                                'conf_sum': 0.0,  # 平均信頼度の集計用（最後に削除）
+                                'conf_count': 0
                             }
+                            if self.track_files:
+                                folder_info['files'] = []
+                            organization_result['species_folders'][folder_name] = folder_info
                     
                     else:
                         # 複数種検出
@@ -103,47 +305,101 @@ class FileManager:
                         folder_name = "multiple_species"
                         organization_result['multiple_species_count'] += 1
                     
-                    # ファイルのコピーまたは移動
-                    target_filename = self._generate_target_filename(
-                        source_path, result, filtered_detections
+                    groups.setdefault(target_folder, []).append(
+                        (result, source_path, folder_name, filtered_detections, source_entry)
                     )
-                    target_path = target_folder / target_filename
-                    
-                    # ファイル名の重複回避
-                    target_path = self._avoid_filename_collision(target_path)
-                    
-                    if copy_files:
-                        shutil.copy2(source_path, target_path)
-                        logger.debug(f"コピー: {source_path} -> {target_path}")
-                    else:
-                        shutil.move(str(source_path), str(target_path))
-                        logger.debug(f"移動: {source_path} -> {target_path}")
+                
+                except Exception as e:
+                    logger.error(f"画像振り分けエラー {result.image_path}: {str(e)}")
+                    organization_result['error_files'].append({
+                        'file': result.image_path,
+                        'error': str(e)
+                    })
+                    organization_result['failed_images'] += 1
+            
+            # 2. 出力ファイル名の決定（フォルダ単位で、作成と重複確認用の走査は1回ずつ）
+            transfers = []  # (result, source_path, target_path, folder_name, filtered_detections, source_entry)
+            
+            for target_folder, group in groups.items():
+                try:
+                    self._ensure_dir(target_folder)
+                    folder_error = None
+                except OSError as e:
+                    folder_error = e
+                
+                for result, source_path, folder_name, filtered_detections, source_entry in group:
+                    try:
+                        if folder_error is not None:
+                            raise folder_error
+                        
+                        target_filename = self._generate_target_filename(
+                            source_path, result, filtered_detections
+                        )
+                        target_path = os.path.join(target_folder, target_filename)
+                        
+                        # ファイル名の重複回避（並列コピー前に選んだ名前とも重複させない）
+                        target_path = self._avoid_filename_collision(target_path)
+                        
+                        transfers.append((result, source_path, target_path, folder_name, filtered_detections, source_entry))
                     
-                    # 統計更新
+                    except Exception as e:
+                        logger.error(f"画像振り分けエラー {result.image_path}: {str(e)}")
+                        organization_result['error_files'].append({
+                            'file': result.image_path,
+                            'error': str(e)
+                        })
+                        organization_result['failed_images'] += 1
+            
+            # 3. ファイルのコピー（並列）または移動（逐次）
+            total_transfers = len(transfers)
+            if copy_files:
+                errors = self._do_copies(
+                    [(transfer[1], transfer[2], transfer[5]) for transfer in transfers], preserve
+                )
+            else:
+                # 移動は元ファイルを消すため、処理順を保ってメインスレッドで実行する
+                errors = (
+                    self._transfer_file(transfer[1], transfer[2], False)
+                    for transfer in transfers
+                )
+            
+            # 4. 統計更新（逐次、投入順に結果を受け取る）
+            for completed, (transfer, error) in enumerate(zip(transfers, errors), 1):
+                result, source_path, target_path, folder_name, filtered_detections, _ = transfer
+                
+                if error is not None:
+                    logger.error(f"画像振り分けエラー {result.image_path}: {error}")
+                    organization_result['error_files'].append({
+                        'file': result.image_path,
+                        'error': error
+                    })
+                    organization_result['failed_images'] += 1
+                
+                else:
                     organization_result['processed_images'] += 1
                     
                     if folder_name in organization_result['species_folders']:
                         folder_info = organization_result['species_folders'][folder_name]
                         folder_info['file_count'] += 1
-                        folder_info['files'].append(str(target_path))
+                        if self.track_files:
+                            folder_info['files'].append(target_path)
                         
-                        # 平均信頼度の更新
+                        # 平均信頼度の集計（平均は最後に1回だけ計算）
+                        # 種別フォルダの画像は閾値以上の検出が1件のみのため、その値を直接加算する
                         if filtered_detections:
-                            confidences = [d.confidence for d in filtered_detections]
-                            avg_conf = sum(confidences) / len(confidences)
-                            current_avg = folder_info['avg_confidence']
-                            count = folder_info['file_count']
-                            folder_info['avg_confidence'] = (
-                                (current_avg * (count - 1) + avg_conf) / count
-                            )
+                            folder_info['conf_sum'] += filtered_detections[0].get('confidence', 0)
+                            folder_info['conf_count'] += 1
                 
-                except Exception as e:
-                    logger.error(f"画像振り分けエラー {result.image_path}: {str(e)}")
-                    organization_result['error_files'].append({
-                        'file': result.image_path,
-                        'error': str(e)
-                    })
-                    organization_result['failed_images'] += 1
+                if progress_callback and (
+                    completed % self.PROGRESS_INTERVAL == 0 or completed == total_transfers
+                ):
+                    progress_callback(completed, total_transfers)
+            
+            # 種別ごとの平均信頼度
+            for folder_info in organization_result['species_folders'].values():
+                conf_sum = folder_info.pop('conf_sum')
+                conf_count = folder_info.pop('conf_count')
+                folder_info['avg_confidence'] = conf_sum / conf_count if conf_count else 0.0
             
             # 振り分け結果レポートの作成
             self._create_organization_report(base_folder, organization_result)
@@ -160,43 +416,105 @@ class FileManager:
         
         return organization_result
     
-    def _sanitize_folder_name(self, species_name: str) -> str:
-        """フォルダ名の無害化"""
-        # Windowsで使用できない文字を除去/置換
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = species_name
-        
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, '_')
-        
-        # 連続するアンダースコアを単一に
-        while '__' in sanitized:
-            sanitized = sanitized.replace('__', '_')
+    def _ensure_dir(self, path: str):
+        """フォルダを作成（作成済みの場合は何もしない）"""
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+    
+    @staticmethod
+    def _scan_source_dir(directory: str, names: Set[str]) -> Optional[Dict[str, os.DirEntry]]:
+        """
+        ソースフォルダを走査して、探しているファイル名 -> DirEntry の辞書を作成
+        
+        Args:
+            directory: ソースフォルダ
+            names: 探すファイル名（normcase済み）
+            
+        Returns:
+            Optional[Dict[str, os.DirEntry]]: 見つかったエントリ。走査に失敗した場合や、
+            フォルダのエントリ数が結果の件数に比べて多すぎる場合はNone（個別に確認する）
+        """
+        max_entries = len(names) * _SCAN_ENTRIES_PER_RESULT
+        found = {}
+        try:
+            with os.scandir(directory or os.curdir) as entries:
+                for count, entry in enumerate(entries, 1):
+                    if count > max_entries:
+                        return None
+                    name = os.path.normcase(entry.name)
+                    if name in names:
+                        found[name] = entry
+        except OSError:
+            return None
+        return found
+    
+    def _do_copies(self, pairs: List[Tuple[str, str, Optional[os.DirEntry]]],
+                   preserve: str = 'all') -> Iterator[Optional[str]]:
+        """
+        (コピー元, コピー先, コピー元のDirEntry) の組をスレッドプールで並列にコピー
+        
+        Returns:
+            Iterator[Optional[str]]: 各組のエラーメッセージ（成功時はNone）を入力順に返す
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(
+                lambda pair: self._transfer_file(pair[0], pair[1], True, pair[2], preserve),
+                pairs
+            )
+    
+    def _transfer_file(self, source_path: str, target_path: str, copy_files: bool,
+                       source_entry: Optional[os.DirEntry] = None,
+                       preserve: str = 'all') -> Optional[str]:
+        """
+        単一ファイルのコピーまたは移動（コピー時はワーカースレッドで実行）
         
-        # 前後の空白とピリオドを除去
-        sanitized = sanitized.strip(' .')
+        source_entry がある場合は preserve='mtime' でそのキャッシュ済みstatを使う。
         
-        # 空の場合のフォールバック
-        if not sanitized:
-            sanitized = "unknown_species"
+        Returns:
+            Optional[str]: エラーメッセージ（成功時はNone）
+        """
+        try:
+            if copy_files:
+                source_stat = (
+                    source_entry.stat()
+                    if preserve == 'mtime' and source_entry is not None else None
+                )
+                _fast_copy2(source_path, target_path, preserve, source_stat)
+                logger.debug("コピー: %s -> %s", source_path, target_path)
+            else:
+                shutil.move(source_path, target_path)
+                logger.debug("移動: %s -> %s", source_path, target_path)
+            return None
         
-        return sanitized
+        except Exception as e:
+            return str(e)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _sanitize_folder_name(species_name: str) -> str:
+        """フォルダ名の無害化（種名ごとに結果をキャッシュ）"""
+        # Windowsで使用できない文字を置換し、連続するアンダースコアを単一にして
+        # 前後の空白とピリオドを除去（空の場合はフォールバック名）
+        sanitized = species_name.translate(_INVALID_FOLDER_CHARS)
+        sanitized = _MULTI_UNDERSCORE_RE.sub('_', sanitized).strip(' .')
+        return sanitized or "unknown_species"
     
-    def _generate_target_filename(self, source_path: Path, 
+    def _generate_target_filename(self, source_path: str, 
                                 result: DetectionResult,
                                 detections: List) -> str:
         """ターゲットファイル名の生成"""
         
         # 基本ファイル名
-        base_name = source_path.stem
-        extension = source_path.suffix
+        base_name, extension = os.path.splitext(os.path.basename(source_path))
         
         # 検出情報の追加
         if detections:
             if len(detections) == 1:
                 detection = detections[0]
-                confidence_str = f"{detection.confidence:.3f}"
-                species_short = detection.species[:10] if detection.species else "unknown"
+                confidence_str = f"{detection.get('confidence', 0):.3f}"
+                species = detection.get('species')
+                species_short = species[:10] if species else "unknown"
                 filename = f"{base_name}_{species_short}_{confidence_str}{extension}"
             else:
                 filename = f"{base_name}_multi_{len(detections)}species{extension}"
@@ -205,27 +523,39 @@ class FileManager:
         
         return filename
     
-    def _avoid_filename_collision(self, target_path: Path) -> Path:
-        """ファイル名の重複回避"""
-        if not target_path.exists():
-            return target_path
-        
-        base_name = target_path.stem
-        extension = target_path.suffix
-        parent = target_path.parent
-        
-        counter = 1
-        while True:
-            new_name = f"{base_name}_{counter:03d}{extension}"
-            new_path = parent / new_name
-            if not new_path.exists():
-                return new_path
-            counter += 1
+    def _get_folder_names(self, folder: str) -> Set[str]:
+        """フォルダ内の使用済みファイル名（初回のみフォルダを走査）"""
+        names = self._folder_names.get(folder)
+        if names is None:
+            try:
+                with os.scandir(folder) as entries:
+                    names = {os.path.normcase(entry.name) for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            self._folder_names[folder] = names
+        return names
+    
+    def _avoid_filename_collision(self, target_path: str) -> str:
+        """ファイル名の重複回避（選んだ名前は使用済みとして記録する）"""
+        parent, name = os.path.split(target_path)
+        names = self._get_folder_names(parent)
+        
+        new_name = name
+        if os.path.normcase(new_name) in names:
+            base_name, extension = os.path.splitext(name)
             
-            if counter > 999:  # 無限ループ防止
-                timestamp = datetime.now().strftime("%H%M%S")
-                new_name = f"{base_name}_{timestamp}{extension}"
-                return parent / new_name
+            # 同じ名前で前回使った連番の続きから探す
+            key = (parent, name)
+            counter = self._collision_counters.get(key, 0)
+            while True:
+                counter += 1
+                new_name = f"{base_name}_{counter:03d}{extension}"
+                if os.path.normcase(new_name) not in names:
+                    break
+            self._collision_counters[key] = counter
+        
+        names.add(os.path.normcase(new_name))
+        return os.path.join(parent, new_name)
     
     def _create_organization_report(self, base_folder: Path, 
                                   organization_result: Dict[str, Any]):
@@ -234,40 +564,49 @@ class FileManager:
         report_path = base_folder / "organization_report.txt"
         
         try:
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write("Wildlife Detector - 画像振り分けレポート\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"実行日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"出力ディレクトリ: {base_folder}\n\n")
+            # レポート全体を組み立ててから1回で書き込む
+            parts = [
+                "Wildlife Detector - 画像振り分けレポート\n",
+                "=" * 50 + "\n\n",
+                f"実行日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"出力ディレクトリ: {base_folder}\n\n",
                 
                 # 全体統計
-                f.write("=== 全体統計 ===\n")
-                f.write(f"総画像数: {organization_result['total_images']}\n")
-                f.write(f"処理成功: {organization_result['processed_images']}\n")
-                f.write(f"処理失敗: {organization_result['failed_images']}\n")
-                f.write(f"検出なし: {organization_result['no_detection_count']}\n")
-                f.write(f"複数種検出: {organization_result['multiple_species_count']}\n\n")
-                
-                # 種別統計
-                if organization_result['species_folders']:
-                    f.write("=== 種別統計 ===\n")
-                    species_folders = organization_result['species_folders']
-                    sorted_species = sorted(species_folders.items(), 
-                                          key=lambda x: x[1]['file_count'], 
-                                          reverse=True)
-                    
-                    for folder_name, info in sorted_species:
-                        f.write(f"\n{info['species_name']} ({info['scientific_name']})\n")
-                        f.write(f"  - カテゴリ: {info['category']}\n")
-                        f.write(f"  - ファイル数: {info['file_count']}\n")
-                        f.write(f"  - 平均信頼度: {info['avg_confidence']:.3f}\n")
-                        f.write(f"  - フォルダ: {folder_name}\n")
+                "=== 全体統計 ===\n"
+                f"総画像数: {organization_result['total_images']}\n"
+                f"処理成功: {organization_result['processed_images']}\n"
+                f"処理失敗: {organization_result['failed_images']}\n"
+                f"検出なし: {organization_result['no_detection_count']}\n"
+                f"複数種検出: {organization_result['multiple_species_count']}\n\n",
+            ]
+            
+            # 種別統計
+            if organization_result['species_folders']:
+                parts.append("=== 種別統計 ===\n")
+                species_folders = organization_result['species_folders']
+                sorted_species = sorted(species_folders.items(), 
+                                      key=lambda x: x[1]['file_count'], 
+                                      reverse=True)
                 
-                # エラーファイル
-                if organization_result['error_files']:
-                    f.write("\n=== エラーファイル ===\n")
-                    for error_info in organization_result['error_files']:
-                        f.write(f"- {error_info['file']}: {error_info['error']}\n")
+                for folder_name, info in sorted_species:
+                    parts.append(
+                        f"\n{info['species_name']} ({info['scientific_name']})\n"
+                        f"  - カテゴリ: {info['category']}\n"
+                        f"  - ファイル数: {info['file_count']}\n"
+                        f"  - 平均信頼度: {info['avg_confidence']:.3f}\n"
+                        f"  - フォルダ: {folder_name}\n"
+                    )
+            
+            # エラーファイル
+            if organization_result['error_files']:
+                parts.append("\n=== エラーファイル ===\n")
+                parts.extend(
+                    f"- {error_info['file']}: {error_info['error']}\n"
+                    for error_info in organization_result['error_files']
+                )
+            
+            with open(report_path, 'w', encoding='utf-8') as f:
+                f.write(''.join(parts))
             
             logger.info(f"振り分けレポート作成: {report_path}")
             
@@ -282,29 +621,37 @@ class FileManager:
             backup_name = f"backup_{self.timestamp}"
         
         backup_folder = self.output_directory / backup_name
-        backup_folder.mkdir(exist_ok=True)
+        self._ensure_dir(str(backup_folder))
         
         logger.info(f"バックアップ作成開始: {len(source_files)} ファイル")
         
         success_count = 0
         error_files = []
         
+        # コピー先の決定（重複回避のため逐次）
+        backup_folder_str = str(backup_folder)
+        pairs = []  # (source_file, target_path, None)
+        
         for source_file in source_files:
             try:
-                source_path = Path(source_file)
-                if not source_path.exists():
+                if not os.path.exists(source_file):
                     error_files.append(f"{source_file}: ファイルが見つかりません")
                     continue
                 
-                target_path = backup_folder / source_path.name
+                target_path = os.path.join(backup_folder_str, Path(source_file).name)
                 target_path = self._avoid_filename_collision(target_path)
-                
-                shutil.copy2(source_path, target_path)
-                success_count += 1
+                pairs.append((source_file, target_path, None))
                 
             except Exception as e:
                 error_files.append(f"{source_file}: {str(e)}")
         
+        # コピー（並列）
+        for (source_file, _, _), error in zip(pairs, self._do_copies(pairs)):
+            if error is None:
+                success_count += 1
+            else:
+                error_files.append(f"{source_file}: {error}")
+        
         logger.info(f"バックアップ完了: {success_count}/{len(source_files)} ファイル")
         
         if error_files:
@@ -332,16 +679,22 @@ class FileManager:
         logger.info(f"空フォルダクリーンアップ開始: {base_path}")
         
         try:
-            # 深い階層から順に処理
-            for folder in sorted(base_path.rglob('*'), key=lambda p: len(p.parts), reverse=True):
-                if folder.is_dir() and folder != base_path:
-                    try:
-                        folder.rmdir()  # 空フォルダのみ削除される
-                        logger.debug(f"空フォルダ削除: {folder}")
-                        removed_count += 1
-                    except OSError:
-                        # フォルダが空でない場合は無視
-                        pass
+            # 深い階層から順に処理（os.walk のボトムアップ走査）
+            base_dir = str(base_path)
+            for folder, _, filenames in os.walk(base_dir, topdown=False):
+                # ファイルを含むフォルダは削除を試みない
+                # （サブフォルダは直前に削除されている場合があるため rmdir の結果で判定）
+                if folder == base_dir or filenames:
+                    continue
+                try:
+                    os.rmdir(folder)  # 空フォルダのみ削除される
+                    self._created_dirs.discard(folder)
+                    self._folder_names.pop(folder, None)
+                    logger.debug("空フォルダ削除: %s", folder)
+                    removed_count += 1
+                except OSError:
+                    # フォルダが空でない場合は無視
+                    pass
         
         except Exception as e:
             logger.error(f"空フォルダクリーンアップエラー: {str(e)}")
@@ -358,16 +711,7 @@ class FileManager:
         path = Path(directory)
         
         try:
-            total_size = 0
-            file_count = 0
-            folder_count = 0
-            
-            for item in path.rglob('*'):
-                if item.is_file():
-                    total_size += item.stat().st_size
-                    file_count += 1
-                elif item.is_dir():
-                    folder_count += 1
+            total_size, file_count, folder_count = self._scan_disk_usage(str(path))
             
             # 可読形式のサイズ
             size_mb = total_size / (1024 * 1024)
@@ -389,6 +733,37 @@ class FileManager:
                 'error': str(e)
             }
     
+    @classmethod
+    def _scan_disk_usage(cls, directory: str) -> Tuple[int, int, int]:
+        """
+        os.scandir による再帰走査で (合計サイズ, ファイル数, フォルダ数) を集計
+        
+        DirEntry の種別判定とstatはキャッシュされるため、エントリごとの追加のstatを省ける。
+        シンボリックリンクはたどらず、読み取れないサブフォルダは中身を除いて集計する。
+        """
+        total_size = 0
+        file_count = 0
+        folder_count = 0
+        
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                    file_count += 1
+                elif entry.is_dir(follow_symlinks=False):
+                    folder_count += 1
+                    try:
+                        sub_size, sub_files, sub_folders = cls._scan_disk_usage(entry.path)
+                    except OSError as e:
+                        # 読み取れないサブフォルダ（権限なし等）は中身を集計せずに続行
+                        logger.debug("ディスク使用量の走査をスキップ: %s (%s)", entry.path, e)
+                        continue
+                    total_size += sub_size
+                    file_count += sub_files
+                    folder_count += sub_folders
+        
+        return total_size, file_count, folder_count
+    
     def get_output_directory(self) -> str:
         """出力ディレクトリのパス取得"""
         return str(self.output_directory)